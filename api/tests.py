@@ -73,3 +73,15 @@ class APIRootTestCase(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["message"], "Django Backend Boilerplate API")
+
+    def test_api_root_urls_follow_request_host(self):
+        """Test that cached URLs are built for the host of each request."""
+        with self.settings(ALLOWED_HOSTS=["testserver", "api.example.com"]):
+            default = self.client.get("/api/v1/")
+            other = self.client.get("/api/v1/", HTTP_HOST="api.example.com")
+
+        self.assertEqual(default.data["versions"]["v1"], "http://testserver/api/v1/")
+        self.assertEqual(
+            other.data["authentication"]["login"],
+            "http://api.example.com/api/v1/auth/token/",
+        )
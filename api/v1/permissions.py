@@ -9,7 +9,7 @@ from django.utils.translation import gettext_lazy as _
 from rest_framework.permissions import BasePermission
 
 from common.permissions.org_scoped import IsAuthenticatedAndInOrgWithRole
-from constants.roles import OrgRole
+from constants.roles import ADMIN_OR_MANAGER_ROLES, OrgRole
 
 
 class IsAuthenticatedAndInOrgWithRole(IsAuthenticatedAndInOrgWithRole):
@@ -89,7 +89,7 @@ class CanViewUserData(BasePermission):
 
         for org in shared_orgs:
             user_role = request.user.get_role(org)
-            if user_role in [OrgRole.SUPER_ADMIN, OrgRole.ADMIN, OrgRole.MANAGER]:
+            if user_role in ADMIN_OR_MANAGER_ROLES:
                 return True
 
         return False
@@ -74,16 +74,23 @@ class OrganizationSerializer(serializers.ModelSerializer):
     
     def get_members_count(self, obj):
         """Get count of organization members."""
+        # Prefer the count annotated by OrganizationViewSet.get_queryset
+        if hasattr(obj, "_members_count"):
+            return obj._members_count
         return obj.user_memberships.count()
     
     def get_projects_count(self, obj):
         """Get count of organization projects."""
+        if hasattr(obj, "_projects_count"):
+            return obj._projects_count
         return obj.projects.count()
     
     def get_user_role(self, obj):
         """Get current user's role in this organization."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            if hasattr(obj, "_user_role"):
+                return obj._user_role
             return request.user.get_role(obj)
         return None
     
@@ -176,6 +183,38 @@ class ProjectSerializer(serializers.ModelSerializer):
         return value.strip()
 
 
+class PublicProjectSerializer(serializers.ModelSerializer):
+    """
+    Minimal read-only serializer for Project exposed to any org member.
+    """
+    
+    organization_name = serializers.CharField(
+        source="organization.name",
+        read_only=True
+    )
+    
+    class Meta:
+        model = Project
+        fields = [
+            "id",
+            "title",
+            "description",
+            "status",
+            "organization",
+            "organization_name",
+            "created_at"
+        ]
+        read_only_fields = [
+            "id",
+            "title",
+            "description",
+            "status",
+            "organization",
+            "organization_name",
+            "created_at"
+        ]
+
+
 class CreateProjectSerializer(serializers.ModelSerializer):
     """Serializer for creating new projects."""
     
@@ -289,6 +328,8 @@ class SimplifiedOrganizationSerializer(serializers.ModelSerializer):
         """Get current user's role in this organization."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            if hasattr(obj, "_user_role"):
+                return obj._user_role
             return request.user.get_role(obj)
         return None
 
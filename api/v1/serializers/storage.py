@@ -5,6 +5,7 @@ This module provides serializers for file upload, download, and management
 operations with proper validation and data formatting.
 """
 
+import copy
 import json
 from typing import Dict, Any, List
 
@@ -13,7 +14,27 @@ from django.core.files.uploadedfile import UploadedFile
 from django.utils.translation import gettext_lazy as _
 
 
-class FileUploadSerializer(serializers.Serializer):
+class CachedFieldsMixin:
+    """
+    Build a serializer's declared fields once per class.
+    
+    DRF deep-copies every declared field for each serializer instance. These
+    serializers are created on every storage request, so the fields are
+    copied once into a per-class prototype and each instance gets shallow
+    copies of it. Only use this on serializers whose fields have no nested
+    serializers or child fields, since those would be shared between copies.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        prototype = cls.__dict__.get('_prototype_fields')
+        if prototype is None:
+            prototype = copy.deepcopy(self._declared_fields)
+            cls._prototype_fields = prototype
+        return {name: copy.copy(field) for name, field in prototype.items()}
+
+
+class FileUploadSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for file upload operations.
     
@@ -161,7 +182,20 @@ class FileUploadSerializer(serializers.Serializer):
         return value
 
 
-class FileInfoSerializer(serializers.Serializer):
+class BulkDeleteSerializer(serializers.Serializer):
+    """
+    Serializer for bulk file deletion requests.
+    """
+    
+    file_paths = serializers.ListField(
+        child=serializers.CharField(max_length=500),
+        allow_empty=False,
+        max_length=1000,
+        help_text=_("Paths of the files to delete (max 1000)")
+    )
+
+
+class FileInfoSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for file information.
     
@@ -233,7 +267,7 @@ class FileInfoSerializer(serializers.Serializer):
     )
 
 
-class FileListItemSerializer(serializers.Serializer):
+class FileListItemSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for individual file list items.
     """
@@ -256,7 +290,8 @@ class FileListItemSerializer(serializers.Serializer):
     )
     
     url = serializers.URLField(
-        help_text=_("File access URL")
+        allow_null=True,
+        help_text=_("File access URL (null when include_urls is false)")
     )
 
 
@@ -269,9 +304,14 @@ class FileListSerializer(serializers.Serializer):
         many=True,
         help_text=_("List of files")
     )
+    
+    next_cursor = serializers.CharField(
+        allow_null=True,
+        help_text=_("Cursor for the next page, null on the last page")
+    )
 
 
-class StorageUsageSerializer(serializers.Serializer):
+class StorageUsageSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for storage usage statistics.
     """
@@ -297,7 +337,7 @@ class StorageUsageSerializer(serializers.Serializer):
     )
 
 
-class FileDownloadResponseSerializer(serializers.Serializer):
+class FileDownloadResponseSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for file download responses.
     """
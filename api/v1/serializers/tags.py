@@ -69,6 +69,15 @@ class CreateTagSerializer(TagSerializer):
         ]
 
 
+class PublicTagSerializer(serializers.ModelSerializer):
+    """Minimal tag serializer for public access."""
+    
+    class Meta:
+        model = Tag
+        fields = ["id", "title", "definition", "created_at"]
+        read_only_fields = ["id", "title", "definition", "created_at"]
+
+
 class TagSummarySerializer(serializers.Serializer):
     """
     Serializer for tag summary information (used in tag listing endpoints).
@@ -150,10 +150,13 @@ class UserWithOrganizationsSerializer(UserProfileSerializer):
     def get_default_organization(self, obj):
         """
         Get the user's default organization information.
+
+        Read from the memberships already loaded for ``organizations``.
         """
-        default_org = obj.get_default_organization()
-        if default_org:
-            return {"id": default_org.id, "name": default_org.name}
+        for membership in obj.organization_memberships.all():
+            if membership.is_default:
+                default_org = membership.organization
+                return {"id": default_org.id, "name": default_org.name}
         return None
 
 
@@ -206,3 +209,34 @@ class CreateUserSerializer(serializers.ModelSerializer):
         password = validated_data.pop("password")
         user = User.objects.create_user(password=password, **validated_data)
         return user
+
+
+class ChangePasswordSerializer(serializers.Serializer):
+    """
+    Serializer for changing the current user's password.
+    """
+
+    current_password = serializers.CharField(required=True)
+    new_password = serializers.CharField(required=True, min_length=8)
+    new_password_confirm = serializers.CharField(required=True)
+
+    def validate(self, attrs):
+        """
+        Validate that the new passwords match.
+        """
+        if attrs["new_password"] != attrs["new_password_confirm"]:
+            raise serializers.ValidationError(
+                {"new_password_confirm": _("New passwords do not match.")}
+            )
+        return attrs
+
+
+class PublicUserSerializer(serializers.ModelSerializer):
+    """
+    Minimal user serializer for public access.
+    """
+
+    class Meta:
+        model = User
+        fields = ["id", "full_name", "date_joined"]
+        read_only_fields = ["id", "full_name", "date_joined"]
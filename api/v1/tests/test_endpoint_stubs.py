@@ -5,13 +5,23 @@ Ensures each stub returns the expected status code and response shape
 matches the documented contract.
 """
 
+import json
+import re
+from unittest.mock import Mock, patch
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 
-from core.factories import UserFactory, OrganizationFactory, OrganizationMembershipFactory, ProjectFactory
+from api.v1.views.tags import TagViewSet
+from core.factories import (
+    UserFactory, OrganizationFactory, OrganizationMembershipFactory, ProjectFactory, TagFactory,
+    EvidenceSourceFactory, EvidenceFactFactory,
+)
 from constants.roles import OrgRole
 
 User = get_user_model()
@@ -353,8 +363,16 @@ class TestStorageEndpoints:
         assert 'used_bytes' in response.data
         assert 'quota_bytes' in response.data
     
-    def test_create_signed_upload_url(self):
+    @patch('api.v1.views.storage_new.StorageService')
+    def test_create_signed_upload_url(self, mock_service_class):
         """Test creating signed upload URL."""
+        OrganizationMembershipFactory(
+            user=self.user,
+            organization=OrganizationFactory(),
+            role=OrgRole.ADMIN,
+            is_default=True
+        )
+        mock_service_class.return_value.get_upload_url.return_value = "https://signed-upload-url.com/file"
         url = reverse('storage-signed-upload')
         data = {
             "file_name": "test.pdf",
@@ -364,8 +382,40 @@ class TestStorageEndpoints:
         response = self.client.post(url, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
-        assert 'signed_url' in response.data
-        assert 'file_path' in response.data
+        assert response.data['signed_url'] == "https://signed-upload-url.com/file"
+        assert response.data['file_path'].endswith('.pdf')
+        assert re.fullmatch(
+            rf"evidence-files/{self.user.id}/\d{{13}}_[0-9a-f]{{8}}\.pdf",
+            response.data['file_path']
+        )
+    
+    @patch('api.v1.views.storage_new.StorageService')
+    def test_create_signed_upload_url_signing_failure(self, mock_service_class):
+        """Test signing failures return a 503 error body instead of crashing."""
+        OrganizationMembershipFactory(
+            user=self.user,
+            organization=OrganizationFactory(),
+            role=OrgRole.ADMIN,
+            is_default=True
+        )
+        mock_service_class.return_value.get_upload_url.side_effect = AttributeError(
+            "you need a private key to sign credentials"
+        )
+        url = reverse('storage-signed-upload')
+        
+        response = self.client.post(url, {"file_name": "test.pdf"}, format='json')
+        
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert 'error' in response.data
+        assert 'private key' not in response.data['error']
+    
+    def test_create_signed_upload_url_requires_organization(self):
+        """Test signed upload URLs need an organization context."""
+        url = reverse('storage-signed-upload')
+        
+        response = self.client.post(url, {"file_name": "test.pdf"}, format='json')
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.django_db
@@ -407,6 +457,125 @@ class TestTagEndpoints:
         
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['title'] == data['title']
+    
+    def test_tag_usage_count(self):
+        """Test counting evidence in a project that uses the given tags."""
+        source = EvidenceSourceFactory(
+            organization=self.org, add_projects=[self.project], add_tags=['alpha']
+        )
+        EvidenceFactFactory(
+            organization=self.org, source=source, confidence_score=0.5,
+            add_tags=['alpha', 'beta'],
+        )
+        EvidenceSourceFactory(organization=self.org, add_tags=['alpha'])  # Other project
+        
+        url = reverse('tags-usage-count')
+        response = self.client.get(url, {
+            'project_id': str(self.project.id),
+            'tags': json.dumps(['alpha', 'beta']),
+        })
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 2
+        
+        response = self.client.get(url, {
+            'project_id': str(self.project.id),
+            'tags': ['alpha', 'beta'],
+        })
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 2
+    
+    def test_tag_usage_count_single_query(self):
+        """Test all evidence types are counted in one query."""
+        EvidenceSourceFactory(
+            organization=self.org, add_projects=[self.project], add_tags=['alpha']
+        )
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('tags-usage-count'), {
+                'project_id': str(self.project.id), 'tags': ['alpha'],
+            })
+        
+        assert response.data['count'] == 1
+        evidence_queries = [
+            q['sql'] for q in queries if 'core_evidencesource' in q['sql']
+        ]
+        assert len(evidence_queries) == 1
+        assert 'core_evidencefact' in evidence_queries[0]
+        assert 'core_evidenceinsight' in evidence_queries[0]
+    
+    def test_tag_usage_count_skips_soft_deleted_evidence(self):
+        """Test soft-deleted evidence does not count towards tag usage."""
+        EvidenceSourceFactory(
+            organization=self.org, add_projects=[self.project], add_tags=['alpha']
+        )
+        deleted = EvidenceSourceFactory(
+            organization=self.org, add_projects=[self.project], add_tags=['alpha']
+        )
+        deleted.soft_delete()
+        
+        response = self.client.get(reverse('tags-usage-count'), {
+            'project_id': str(self.project.id), 'tags': ['alpha'],
+        })
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 1
+    
+    def test_tag_usage_count_invalid_params(self):
+        """Test tag usage count rejects malformed tags and project ids."""
+        url = reverse('tags-usage-count')
+        
+        response = self.client.get(url, {
+            'project_id': str(self.project.id), 'tags': '["alpha"'
+        })
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        
+        response = self.client.get(url, {'project_id': str(self.project.id)})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        
+        response = self.client.get(url, {
+            'project_id': 'not-a-uuid', 'tags': json.dumps(['alpha'])
+        })
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_public_tags_list(self):
+        """Test public tag listing returns only the public fields."""
+        tag = TagFactory(organization=self.org)
+        TagFactory()  # Tag in another organization
+        
+        response = self.client.get(reverse('public-tags-list'))
+        
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data['results'] if isinstance(response.data, dict) else response.data
+        assert [item['id'] for item in results] == [str(tag.id)]
+        assert set(results[0]) == {'id', 'title', 'definition', 'created_at'}
+    
+    def test_public_tags_paginated(self):
+        """Test public tag listing honours page and items_per_page."""
+        tags = [TagFactory(organization=self.org) for _ in range(3)]
+        newest_first = sorted(tags, key=lambda t: (t.created_at, t.id), reverse=True)
+        
+        url = reverse('public-tags-list')
+        response = self.client.get(url, {'page': 2, 'items_per_page': 2})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        assert [item['id'] for item in response.data['results']] == [str(newest_first[2].id)]
+    
+    def test_get_organization_memoized_per_view(self):
+        """Test that the organization is looked up once per view instance."""
+        view = TagViewSet()
+        view.kwargs = {}
+        view.request = Mock(user=self.user)
+        
+        with patch.object(
+            User, 'get_default_organization', autospec=True, return_value=self.org
+        ) as mock_default:
+            assert view.get_organization() == self.org
+            assert view.get_organization() == self.org
+        
+        assert mock_default.call_count == 1
 
 
 @pytest.mark.django_db
@@ -0,0 +1,53 @@
+"""
+Tests for the health check API endpoint.
+"""
+
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import OperationalError
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+
+class HealthCheckAPITestCase(APITestCase):
+    """Test cases for the health check endpoint."""
+
+    def test_health_check_healthy(self):
+        """Test health endpoint reports healthy when the database is reachable."""
+        response = self.client.get(reverse("api-health-check"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "healthy")
+        self.assertEqual(response.data["checks"]["database"], "healthy")
+        self.assertEqual(response.data["checks"]["django"], "healthy")
+        self.assertEqual(response.data["environment"], settings.DJANGO_ENV)
+
+    def test_health_check_database_unavailable(self):
+        """Test health endpoint returns 503 when the database connection fails."""
+        with patch("api.v1.views.health.connections") as mock_connections:
+            mock_connections.__getitem__.return_value.ensure_connection.side_effect = (
+                OperationalError("connection refused")
+            )
+            response = self.client.get(reverse("api-health-check"))
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.data["status"], "unhealthy")
+        self.assertEqual(
+            response.data["checks"]["database"], "error: connection refused"
+        )
+
+    def test_health_check_does_not_open_cursor(self):
+        """Test the database check verifies the connection without a cursor."""
+        with patch("api.v1.views.health.connections") as mock_connections:
+            db_conn = mock_connections.__getitem__.return_value
+            self.client.get(reverse("api-health-check"))
+
+        db_conn.ensure_connection.assert_called_once_with()
+        db_conn.cursor.assert_not_called()
+
+    def test_health_check_no_auth_required(self):
+        """Test that health endpoint doesn't require authentication."""
+        response = self.client.get(reverse("api-health-check"))
+        self.assertNotEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,272 @@
+"""
+Tests for organization, membership and project viewset behaviour.
+
+Covers organization scoping and the per-request query helpers shared
+by the organization-scoped viewsets.
+"""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+
+from api.v1.views.base import get_user_org_ids
+from api.v1.views.organization import OrganizationMembershipViewSet
+from constants.roles import OrgRole
+from core.factories import (
+    OrganizationFactory,
+    OrganizationMembershipFactory,
+    ProjectFactory,
+    UserFactory,
+)
+from core.models import Project
+
+
+@pytest.mark.django_db
+class TestUserOrgIdsHelper:
+    """Test the memoized organization ID lookup."""
+
+    def setup_method(self):
+        """Set up test data."""
+        self.user = UserFactory()
+        self.admin_org = OrganizationFactory()
+        self.viewer_org = OrganizationFactory()
+        OrganizationMembershipFactory(
+            user=self.user, organization=self.admin_org, role=OrgRole.ADMIN
+        )
+        OrganizationMembershipFactory(
+            user=self.user, organization=self.viewer_org, role=OrgRole.VIEWER
+        )
+        self.request = APIRequestFactory().get("/")
+        self.request.user = self.user
+
+    def test_returns_all_memberships_without_roles(self):
+        """Test all organizations are returned when no roles are given."""
+        org_ids = get_user_org_ids(self.request)
+
+        assert set(org_ids) == {self.admin_org.id, self.viewer_org.id}
+
+    def test_filters_by_roles(self):
+        """Test only organizations with a matching role are returned."""
+        org_ids = get_user_org_ids(self.request, [OrgRole.ADMIN, OrgRole.MANAGER])
+
+        assert org_ids == [self.admin_org.id]
+
+    def test_result_is_memoized_per_request(self, django_assert_num_queries):
+        """Test repeated lookups for the same roles hit the database once."""
+        with django_assert_num_queries(1):
+            get_user_org_ids(self.request, [OrgRole.ADMIN])
+            get_user_org_ids(self.request, [OrgRole.ADMIN])
+
+
+@pytest.mark.django_db
+class TestOrganizationScoping:
+    """Test organization-scoped querysets."""
+
+    def setup_method(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.user = UserFactory()
+        self.org = OrganizationFactory()
+        self.other_org = OrganizationFactory()
+        OrganizationMembershipFactory(
+            user=self.user, organization=self.org, role=OrgRole.ADMIN, is_default=True
+        )
+        self.project = ProjectFactory(organization=self.org)
+        self.other_project = ProjectFactory(organization=self.other_org)
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_organizations_only_includes_memberships(self):
+        """Test users only see organizations they belong to."""
+        response = self.client.get(reverse("organizations-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        ids = {org["id"] for org in response.data["results"]}
+        assert ids == {str(self.org.id)}
+
+    def test_list_projects_only_includes_member_orgs(self):
+        """Test users only see projects from their organizations."""
+        response = self.client.get(reverse("projects-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        ids = {project["id"] for project in response.data["results"]}
+        assert ids == {str(self.project.id)}
+
+    def test_list_organizations_includes_annotated_counts(self):
+        """Test member/project counts and role are correct on list."""
+        OrganizationMembershipFactory(organization=self.org, role=OrgRole.VIEWER)
+        ProjectFactory(organization=self.org)
+
+        response = self.client.get(reverse("organizations-list"))
+
+        org = response.data["results"][0]
+        assert org["members_count"] == 2
+        assert org["projects_count"] == 2
+        assert org["user_role"] == OrgRole.ADMIN
+
+    def test_list_organizations_query_count_is_constant(
+        self, django_assert_max_num_queries
+    ):
+        """Test listing organizations does not issue per-row queries."""
+        for _ in range(5):
+            org = OrganizationFactory()
+            OrganizationMembershipFactory(
+                user=self.user, organization=org, role=OrgRole.VIEWER
+            )
+            ProjectFactory(organization=org)
+
+        with django_assert_max_num_queries(4):
+            response = self.client.get(reverse("organizations-list"))
+
+        assert len(response.data["results"]) == 6
+
+    def test_user_role_returns_membership_role(self):
+        """Test the user-role action returns the caller's role."""
+        response = self.client.get(
+            reverse("organization-memberships-user-role"),
+            {"organization_id": self.org.id},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"role": OrgRole.ADMIN}
+
+    def test_user_role_not_member_returns_404(self):
+        """Test the user-role action returns 404 for non-member organizations."""
+        response = self.client.get(
+            reverse("organization-memberships-user-role"),
+            {"organization_id": self.other_org.id},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_memberships_runs_single_query(self, django_assert_num_queries):
+        """Test membership scoping is resolved in a single statement."""
+        view = OrganizationMembershipViewSet()
+        view.request = APIRequestFactory().get("/")
+        view.request.user = self.user
+        OrganizationMembershipFactory(organization=self.other_org)
+
+        with django_assert_num_queries(1):
+            memberships = list(view.get_queryset())
+
+        assert [m.organization_id for m in memberships] == [self.org.id]
+
+    def test_user_organizations_honours_if_none_match(self):
+        """Test the user-orgs listing returns 304 while memberships are unchanged."""
+        url = reverse("organization-memberships-user-orgs")
+
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.has_header("ETag")
+
+        cached = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+        self.org.name = "Renamed"
+        self.org.save()
+
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed["ETag"] != response["ETag"]
+
+    def test_add_tag_single_name(self):
+        """Test adding one tag keeps the single-tag response shape."""
+        response = self.client.post(
+            reverse("projects-add-tag", args=[self.project.id]),
+            {"name": "urgent"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["tag"]["name"] == "urgent"
+        assert list(self.project.get_tag_names()) == ["urgent"]
+
+    def test_add_tag_restores_soft_deleted_tag(self):
+        """Test re-adding a soft deleted tag restores it instead of failing."""
+        tag = self.project.add_tag("urgent")
+        self.project.tags.clear()
+        tag.soft_delete()
+
+        response = self.client.post(
+            reverse("projects-add-tag", args=[self.project.id]),
+            {"name": "urgent"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["tag"]["id"] == str(tag.id)
+        assert list(self.project.get_tag_names()) == ["urgent"]
+
+    def test_tag_names_must_be_strings(self):
+        """Test non-string tag names are rejected with 400."""
+        bodies = ({"name": 123}, {"names": ["urgent", 123]}, {"names": "urgent"})
+        for url_name, method in (
+            ("projects-add-tag", self.client.post),
+            ("projects-remove-tag", self.client.delete),
+        ):
+            url = reverse(url_name, args=[self.project.id])
+            for body in bodies:
+                response = method(url, body, format="json")
+                assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_add_and_remove_tag_names(self):
+        """Test several tags can be added and removed in one request."""
+        url = reverse("projects-add-tag", args=[self.project.id])
+        response = self.client.post(
+            url, {"names": ["urgent", "important"]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {tag["name"] for tag in response.data["tags"]} == {"urgent", "important"}
+
+        response = self.client.delete(
+            reverse("projects-remove-tag", args=[self.project.id]),
+            {"names": ["urgent", "important"]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self.project.tags.count() == 0
+
+    def test_public_projects_scoped_to_active_member_projects(self):
+        """Test public projects exclude other orgs and on-hold projects."""
+        # ProjectFactory cycles through statuses, so pin both explicitly
+        Project.objects.filter(pk=self.project.pk).update(
+            status=Project.StatusChoices.ON_HOLD
+        )
+        active = ProjectFactory(
+            organization=self.org, status=Project.StatusChoices.IN_PROGRESS
+        )
+
+        response = self.client.get(reverse("public-projects-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["id"] for p in response.data["results"]] == [str(active.id)]
+        assert response.data["results"][0]["title"] == active.title
+
+    def test_remove_tag_other_org_project_returns_404(self):
+        """Test tags cannot be removed from projects outside the user's orgs."""
+        self.other_project.add_tag("urgent")
+
+        response = self.client.delete(
+            reverse("projects-remove-tag", args=[self.other_project.id]),
+            {"name": "urgent"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert list(self.other_project.get_tag_names()) == ["urgent"]
+
+    def test_user_organizations_single_query_for_memberships(
+        self, django_assert_max_num_queries
+    ):
+        """Test user-orgs does not look up the role per organization."""
+        for _ in range(3):
+            OrganizationMembershipFactory(user=self.user, role=OrgRole.VIEWER)
+
+        with django_assert_max_num_queries(5):
+            response = self.client.get(reverse("organization-memberships-user-orgs"))
+
+        assert len(response.data) == 4
+        roles = {item["organization"]["user_role"] for item in response.data}
+        assert roles == {OrgRole.ADMIN, OrgRole.VIEWER}
@@ -15,6 +15,7 @@ from common.permissions.org_scoped import (
     IsOrgAdmin,
     IsOrgAdminOrManager,
     IsOrgMember,
+    get_request_role,
 )
 from constants.roles import OrgRole
 from core.factories import (
@@ -235,10 +236,6 @@ class ConveniencePermissionTestCase(TestCase):
         """Test that IsOrgMember permission includes all defined roles."""
         permission = IsOrgMember()
         view = self._create_mock_view()
-        request = self._create_mock_request(self.admin_user)
-
-        # Call has_permission to set the required_roles on the view
-        permission.has_permission(request, view)
 
         # Verify all roles are included
         expected_roles = [
@@ -248,7 +245,17 @@ class ConveniencePermissionTestCase(TestCase):
             OrgRole.VIEWER,
             OrgRole.SUPER_ADMIN,
         ]
-        self.assertEqual(set(view.required_roles), set(expected_roles))
+        self.assertEqual(set(permission.get_required_roles(view)), set(expected_roles))
+
+    def test_convenience_permissions_do_not_modify_view(self):
+        """Test that convenience permissions leave the view's roles untouched."""
+        request = self._create_mock_request(self.admin_user)
+        view = self._create_mock_view()
+        view.required_roles = [OrgRole.VIEWER]
+
+        for permission in [IsOrgAdmin(), IsOrgAdminOrManager(), IsOrgMember()]:
+            self.assertTrue(permission.has_permission(request, view))
+            self.assertEqual(view.required_roles, [OrgRole.VIEWER])
 
 
 class APISpecificPermissionTestCase(TestCase):
@@ -355,3 +362,61 @@ class APISpecificPermissionTestCase(TestCase):
 
         result = permission.has_object_permission(request, view, self.user1)
         self.assertFalse(result)
+
+
+class RequestRoleMapTestCase(TestCase):
+    """
+    Test that role checks share one membership lookup per request.
+    """
+
+    def test_role_checks_query_memberships_once(self):
+        """Test view and object permission checks reuse the loaded roles."""
+        organization = OrganizationFactory()
+        user = UserFactory()
+        OrganizationMembershipFactory(
+            user=user, organization=organization, role=OrgRole.ADMIN
+        )
+        request = Mock()
+        request.user = user
+        view = Mock()
+        view.required_roles = [OrgRole.ADMIN]
+        view.get_organization.return_value = organization
+        obj = Mock()
+        obj.organization = organization
+        permission = IsAuthenticatedAndInOrgWithRole()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(permission.has_permission(request, view))
+            self.assertTrue(permission.has_object_permission(request, view, obj))
+            self.assertEqual(get_request_role(request, organization.pk), OrgRole.ADMIN)
+
+    def test_object_check_skipped_for_already_permitted_organization(self):
+        """Test objects in the approved organization skip the repeat check."""
+        organization = OrganizationFactory()
+        other_organization = OrganizationFactory()
+        user = UserFactory()
+        OrganizationMembershipFactory(
+            user=user, organization=organization, role=OrgRole.ADMIN
+        )
+        request = Mock()
+        request.user = user
+        view = Mock()
+        view.required_roles = [OrgRole.ADMIN]
+        view.get_organization.return_value = organization
+        permission = IsAuthenticatedAndInOrgWithRole()
+
+        self.assertTrue(permission.has_permission(request, view))
+
+        same_org_obj = Mock(organization_id=organization.pk, organization=organization)
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                permission.has_object_permission(request, view, same_org_obj)
+            )
+        self.assertEqual(view.get_organization.call_count, 1)
+
+        other_org_obj = Mock(
+            organization_id=other_organization.pk, organization=other_organization
+        )
+        self.assertFalse(
+            permission.has_object_permission(request, view, other_org_obj)
+        )
@@ -15,9 +15,12 @@ from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
+
+from api.v1.views.storage import LISTING_URL_EXPIRE_SECONDS, StorageAPIView
 
 from core.factories import UserFactory, OrganizationFactory, OrganizationMembershipFactory
+from core.services.storage import signed_url_cache_timeout
 from constants.roles import OrgRole
 
 
@@ -245,6 +248,7 @@ class TestStorageAPI:
         assert response.status_code == status.HTTP_200_OK
         assert 'download_url' in response.data
         assert response.data['download_url'] == "https://signed-url.com/file"
+        assert response['Cache-Control'] == "private, max-age=2700"
 
     @patch('api.v1.views.storage.StorageService')
     def test_download_file_not_found(self, mock_service_class):
@@ -288,13 +292,56 @@ class TestStorageAPI:
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    @patch('api.v1.views.storage.StorageService')
+    def test_bulk_delete_files_success(self, mock_service_class):
+        """Test deleting several files in one request."""
+        mock_service = MagicMock()
+        mock_service_class.return_value = mock_service
+        mock_service.delete_files.return_value = 2
+        
+        self.client.force_authenticate(user=self.admin_user)
+        
+        response = self.client.post(
+            reverse('storage-bulk-delete'),
+            {'file_paths': ['a.txt', 'docs/b.txt']},
+            format='json'
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['deleted_count'] == 2
+        mock_service.delete_files.assert_called_once_with(['a.txt', 'docs/b.txt'])
+
+    def test_bulk_delete_files_limit(self):
+        """Test bulk deletion rejects more than 1000 paths."""
+        self.client.force_authenticate(user=self.admin_user)
+        
+        response = self.client.post(
+            reverse('storage-bulk-delete'),
+            {'file_paths': [f'file{i}.txt' for i in range(1001)]},
+            format='json'
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_delete_files_forbidden_viewer(self):
+        """Test bulk deletion forbidden for viewer."""
+        self.client.force_authenticate(user=self.viewer_user)
+        
+        response = self.client.post(
+            reverse('storage-bulk-delete'),
+            {'file_paths': ['a.txt']},
+            format='json'
+        )
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
     @patch('api.v1.views.storage.StorageService')
     def test_list_files_success(self, mock_service_class):
         """Test successful file listing."""
         # Mock storage service
         mock_service = MagicMock()
         mock_service_class.return_value = mock_service
-        mock_service.list_files.return_value = [
+        mock_service.list_files_page.return_value = {'next_page_token': None, 'files': [
             {
                 'name': 'file1.txt',
                 'path': 'file1.txt',
@@ -309,7 +356,7 @@ class TestStorageAPI:
                 'modified_time': None,
                 'url': 'https://url2.com'
             }
-        ]
+        ]}
         
         self.client.force_authenticate(user=self.viewer_user)
         
@@ -320,6 +367,195 @@ class TestStorageAPI:
         assert response.status_code == status.HTTP_200_OK
         assert 'files' in response.data
         assert len(response.data['files']) == 2
+        assert response.data['next_cursor'] is None
+
+    @patch('api.v1.views.storage.StorageService')
+    def test_list_files_pagination(self, mock_service_class):
+        """Test page size and cursor are passed through and the next cursor returned."""
+        mock_service = mock_service_class.return_value
+        mock_service.list_files_page.return_value = {'files': [], 'next_page_token': 'token-2'}
+        
+        self.client.force_authenticate(user=self.viewer_user)
+        
+        response = self.client.get(
+            reverse('storage-list'), {'page_size': 50, 'cursor': 'token-1'}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['next_cursor'] == 'token-2'
+        mock_service.list_files_page.assert_called_once_with(
+            directory='', category=None, page_size=50, page_token='token-1',
+            include_urls=True
+        )
+
+    @patch('api.v1.views.storage.StorageService')
+    def test_list_files_without_urls(self, mock_service_class):
+        """Test include_urls=0 skips signing download URLs."""
+        mock_service = mock_service_class.return_value
+        mock_service.list_files_page.return_value = {'files': [], 'next_page_token': None}
+        
+        self.client.force_authenticate(user=self.viewer_user)
+        
+        response = self.client.get(reverse('storage-list'), {'include_urls': '0'})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_service.list_files_page.call_args.kwargs['include_urls'] is False
+
+    def test_list_files_invalid_page_size(self):
+        """Test out-of-range or non-numeric page sizes are rejected."""
+        self.client.force_authenticate(user=self.viewer_user)
+        url = reverse('storage-list')
+        
+        for page_size in ['0', '1001', 'abc']:
+            response = self.client.get(url, {'page_size': page_size})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @patch('api.v1.views.storage.StorageService')
+    def test_list_files_renders_same_as_serializer(self, mock_service_class):
+        """Test listing output matches the documented FileListSerializer format."""
+        from datetime import datetime, timezone
+        from api.v1.serializers.storage import FileListSerializer
+        
+        files = [{
+            'name': 'file1.txt',
+            'path': 'docs/file1.txt',
+            'size': 100,
+            'modified_time': datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+            'url': 'https://url1.com'
+        }]
+        mock_service_class.return_value.list_files_page.return_value = {
+            'files': files, 'next_page_token': None
+        }
+        
+        self.client.force_authenticate(user=self.viewer_user)
+        
+        response = self.client.get(reverse('storage-list'))
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == json.loads(
+            json.dumps(FileListSerializer({'files': files, 'next_cursor': None}).data)
+        )
+
+    @patch('api.v1.views.storage.StorageService')
+    def test_get_file_info_honours_if_none_match(self, mock_service_class):
+        """Test file info returns 304 while the file is unchanged."""
+        mock_service = mock_service_class.return_value
+        mock_service.get_file_info.return_value = {
+            'path': 'test/file.txt',
+            'size': 100,
+            'exists': True,
+            'url': 'https://signed-url.com'
+        }
+        self.client.force_authenticate(user=self.viewer_user)
+        url = reverse('storage-info', kwargs={'file_path': 'test/file.txt'})
+        
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.has_header('ETag')
+        
+        cached = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert cached.content == b''
+        
+        mock_service.get_file_info.return_value['size'] = 200
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed['ETag'] != response['ETag']
+
+    @patch('api.v1.views.storage.StorageService')
+    def test_list_files_honours_if_none_match(self, mock_service_class):
+        """Test listing returns 304 while the page is unchanged."""
+        mock_service_class.return_value.list_files_page.return_value = {
+            'files': [{'name': 'a.txt', 'path': 'a.txt', 'size': 1, 'modified_time': None, 'url': None}],
+            'next_page_token': None
+        }
+        self.client.force_authenticate(user=self.viewer_user)
+        url = reverse('storage-list')
+        
+        response = self.client.get(url, {'include_urls': '0'})
+        cached = self.client.get(url, {'include_urls': '0'}, HTTP_IF_NONE_MATCH=response['ETag'])
+        
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @patch('api.v1.views.storage.time.time', return_value=1_700_000_000)
+    @patch('api.v1.views.storage.StorageService')
+    def test_list_files_etag_ignores_fresh_signed_urls(self, mock_service_class, mock_time):
+        """Test default listings revalidate even though URLs are re-signed."""
+        page = {
+            'files': [{
+                'name': 'a.txt', 'path': 'a.txt', 'size': 1,
+                'modified_time': '2024-01-01T00:00:00Z',
+                'url': 'https://signed-url.com/a.txt?sig=1'
+            }],
+            'next_page_token': None
+        }
+        mock_service_class.return_value.list_files_page.return_value = page
+        self.client.force_authenticate(user=self.viewer_user)
+        url = reverse('storage-list')
+        
+        response = self.client.get(url)
+        page['files'][0]['url'] = 'https://signed-url.com/a.txt?sig=2'
+        cached = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        page['files'][0]['size'] = 2
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert changed.status_code == status.HTTP_200_OK
+        
+        other_page = self.client.get(
+            url, {'page_size': '10'}, HTTP_IF_NONE_MATCH=changed['ETag']
+        )
+        assert other_page.status_code == status.HTTP_200_OK
+
+    @patch('api.v1.views.storage.time.time')
+    @patch('api.v1.views.storage.StorageService')
+    def test_list_files_etag_expires_with_signed_urls(self, mock_service_class, mock_time):
+        """Test listings with URLs stop revalidating once the URLs age."""
+        mock_service_class.return_value.list_files_page.return_value = {
+            'files': [{
+                'name': 'a.txt', 'path': 'a.txt', 'size': 1,
+                'modified_time': '2024-01-01T00:00:00Z',
+                'url': 'https://signed-url.com/a.txt'
+            }],
+            'next_page_token': None
+        }
+        self.client.force_authenticate(user=self.viewer_user)
+        url = reverse('storage-list')
+        mock_time.return_value = 1_700_000_000
+        
+        response = self.client.get(url)
+        without_urls = self.client.get(url, {'include_urls': '0'})
+        mock_time.return_value += signed_url_cache_timeout(LISTING_URL_EXPIRE_SECONDS)
+        
+        expired = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert expired.status_code == status.HTTP_200_OK
+        
+        cached = self.client.get(
+            url, {'include_urls': '0'}, HTTP_IF_NONE_MATCH=without_urls['ETag']
+        )
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @patch('api.v1.views.storage.StorageService')
+    def test_unexpected_error_returns_500(self, mock_service_class):
+        """Test unexpected service errors return the action's error message."""
+        mock_service_class.return_value.get_file_info.side_effect = RuntimeError("boom")
+        
+        self.client.force_authenticate(user=self.admin_user)
+        
+        response = self.client.get(reverse('storage-info', kwargs={'file_path': 'test/file.txt'}))
+        
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.data == {'error': 'An unexpected error occurred while getting file info'}
+
+    def test_list_files_invalid_directory_returns_400(self):
+        """Test service validation errors during listing return 400."""
+        self.client.force_authenticate(user=self.viewer_user)
+        
+        response = self.client.get(reverse('storage-list'), {'directory': '../other'})
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'error' in response.data
 
     @patch('api.v1.views.storage.StorageService')
     def test_get_file_info_success(self, mock_service_class):
@@ -393,6 +629,30 @@ class TestStorageAPI:
         # Should succeed but return empty list (different org)
         assert response.status_code == status.HTTP_200_OK
 
+    def test_parsers_only_for_body_actions(self):
+        """Test body parsers are only set up for actions that read a body."""
+        factory = APIRequestFactory()
+        
+        view = StorageAPIView(action_map={'get': 'list_files'})
+        view.request = factory.get('/')
+        assert view.get_parsers() == []
+        
+        view = StorageAPIView(action_map={'post': 'upload_file'})
+        view.request = factory.post('/')
+        assert len(view.get_parsers()) == 3
+
+    def test_get_organization_memoized_per_request(self, django_assert_num_queries):
+        """Test the organization context is looked up once per request."""
+        view = StorageAPIView()
+        view.kwargs = {}
+        view.request = APIRequestFactory().get("/")
+        view.request.user = self.admin_user
+        
+        assert view.get_organization() == self.org1
+        
+        with django_assert_num_queries(0):
+            assert view.get_organization() == self.org1
+
 
 @pytest.mark.django_db
 class TestStorageServiceRBAC:
@@ -457,6 +717,16 @@ class TestStorageServiceRBAC:
         # Viewer should be able to view
         service._check_permission([OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.VIEWER], "file view")
 
+    def test_permission_checks_reuse_role(self, django_assert_num_queries):
+        """Test permission checks don't look the role up again."""
+        from core.services.storage import StorageService
+        
+        service = StorageService(user=self.viewer_user, organization=self.org)
+        
+        with django_assert_num_queries(0):
+            service._check_permission([OrgRole.VIEWER], "file view")
+            service._check_permission([OrgRole.VIEWER], "file listing")
+
     def test_file_path_validation(self):
         """Test file path validation."""
         from core.services.storage import StorageService
@@ -473,4 +743,54 @@ class TestStorageServiceRBAC:
             service._validate_file_path("../../../etc/passwd")
             
         with pytest.raises(ValidationError):
-            service._validate_file_path("a/" * 20)  # Too deep
\ No newline at end of file
+            service._validate_file_path("a/" * 20)  # Too deep
+
+    def test_get_upload_url_requires_upload_role(self):
+        """Test signed upload URLs follow the same RBAC as direct uploads."""
+        from core.services.storage import StorageService
+        from django.core.exceptions import PermissionDenied
+        
+        viewer_service = StorageService(user=self.viewer_user, organization=self.org)
+        with pytest.raises(PermissionDenied):
+            viewer_service.get_upload_url("documents/file.pdf")
+        
+        admin_service = StorageService(user=self.admin_user, organization=self.org)
+        with patch.object(admin_service.storage, 'upload_url', return_value="https://signed") as mock_url:
+            assert admin_service.get_upload_url("documents/file.pdf", "application/pdf") == "https://signed"
+        mock_url.assert_called_once_with(
+            "documents/file.pdf", content_type="application/pdf", expire=3600
+        )
+
+    def test_get_file_url_reuses_signed_url_until_deleted(self):
+        """Test signed download URLs are cached per file and evicted on delete."""
+        from core.services.storage import StorageService
+        
+        service = StorageService(user=self.admin_user, organization=self.org)
+        with patch.object(service.storage, 'exists', return_value=True), \
+                patch.object(service.storage, 'url', side_effect=["https://one", "https://two"]) as mock_url, \
+                patch.object(service.storage, 'delete'):
+            assert service.get_file_url("documents/file.pdf") == "https://one"
+            assert service.get_file_url("documents/file.pdf") == "https://one"
+            
+            service.delete_file("documents/file.pdf")
+            
+            assert service.get_file_url("documents/file.pdf") == "https://two"
+        assert mock_url.call_count == 2
+
+
+class TestCachedSerializerFields:
+    """Test storage serializers reuse their declared field prototypes."""
+
+    def test_instances_get_independent_bound_fields(self):
+        """Test each instance binds its own copy of the cached fields."""
+        from api.v1.serializers.storage import FileInfoSerializer
+        
+        first = FileInfoSerializer({'path': 'a.txt', 'size': 1, 'url': 'https://a'})
+        second = FileInfoSerializer({'path': 'b.txt', 'size': 2, 'url': 'https://b'})
+        
+        assert first.fields['path'] is not second.fields['path']
+        assert first.fields['path'].parent is first
+        assert second.fields['path'].parent is second
+        assert first.data['path'] == 'a.txt'
+        assert second.data['path'] == 'b.txt'
+        assert 'path' in FileInfoSerializer.__dict__['_prototype_fields']
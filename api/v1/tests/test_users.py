@@ -4,6 +4,8 @@ Tests for API v1 user endpoints.
 Tests the /me/ endpoint, user profile management, and organization-scoped access.
 """
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.authtoken.models import Token
@@ -53,6 +55,26 @@ class UserMeEndpointTestCase(APITestCase):
         self.assertEqual(org_data["role"], OrgRole.ADMIN)
         self.assertTrue(org_data["is_default"])
 
+    def test_get_me_query_count_independent_of_memberships(self):
+        """Test that /me/ loads memberships and organizations in one query."""
+        url = reverse("users-me")
+        self.client.get(url)  # Warm up per-process caches
+
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url)
+
+        for _ in range(3):
+            OrganizationMembershipFactory(user=self.user, role=OrgRole.VIEWER)
+
+        with CaptureQueriesContext(connection) as several:
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data["organizations"]), 4)
+        self.assertEqual(
+            response.data["default_organization"]["id"], self.organization.id
+        )
+        self.assertEqual(len(several), len(single))
+
     def test_get_me_endpoint_unauthenticated(self):
         """Test /me/ endpoint without authentication."""
         self.client.credentials()  # Remove authentication
@@ -283,3 +305,37 @@ class UserViewSetTestCase(APITestCase):
         self.assertIn(self.admin_user.email, user_emails)
         self.assertIn(self.manager_user.email, user_emails)
         self.assertIn(self.viewer_user.email, user_emails)
+
+    def test_user_queryset_reuses_org_ids_per_request(self):
+        """Test repeated get_queryset calls look up memberships once."""
+        from rest_framework.test import APIRequestFactory
+
+        from api.v1.views.user import UserViewSet
+
+        view = UserViewSet()
+        view.request = APIRequestFactory().get("/")
+        view.request.user = self.admin_user
+
+        # One membership lookup shared by both calls, one user query
+        with self.assertNumQueries(2):
+            first = view.get_queryset()
+            second = view.get_queryset()
+            list(first.values_list("pk", flat=True))
+        self.assertEqual(set(first), set(second))
+
+    def test_user_in_several_shared_orgs_listed_once(self):
+        """Test users sharing several organizations are not duplicated."""
+        second_org = OrganizationFactory()
+        OrganizationMembershipFactory(
+            user=self.admin_user, organization=second_org, role=OrgRole.ADMIN
+        )
+        OrganizationMembershipFactory(
+            user=self.viewer_user, organization=second_org, role=OrgRole.VIEWER
+        )
+        token = Token.objects.create(user=self.admin_user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        response = self.client.get(reverse("users-list"))
+
+        user_emails = [user["email"] for user in response.data["results"]]
+        self.assertEqual(user_emails.count(self.viewer_user.email), 1)
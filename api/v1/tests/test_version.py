@@ -14,6 +14,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from api.v1.views.version import _load_version
 from scripts.write_version_file import (
     create_version_info,
     get_git_branch,
@@ -133,6 +134,10 @@ class VersionScriptTestCase(TestCase):
 class VersionAPITestCase(APITestCase):
     """Test cases for the version API endpoint."""
 
+    def setUp(self):
+        _load_version.cache_clear()
+        self.addCleanup(_load_version.cache_clear)
+
     def test_version_endpoint_with_file(self):
         """Test version endpoint when version.json exists."""
         # Create temporary version file
@@ -196,6 +201,25 @@ class VersionAPITestCase(APITestCase):
         expected = {"commit": "unknown", "timestamp": "unknown", "branch": "unknown"}
         self.assertEqual(response.data, expected)
 
+    def test_version_file_read_once(self):
+        """Test that version.json is only read on the first request."""
+        version_data = {"commit": "abc", "timestamp": "t", "branch": "main"}
+        with patch("api.v1.views.version.Path") as mock_path:
+            mock_version_file = MagicMock()
+            mock_version_file.exists.return_value = True
+            mock_path.return_value.__truediv__.return_value = mock_version_file
+
+            with patch("builtins.open", create=True) as mock_open:
+                with patch("json.load", return_value=version_data):
+                    url = reverse("api-version")
+                    first = self.client.get(url)
+                    second = self.client.get(url)
+
+        self.assertEqual(first.data, version_data)
+        self.assertEqual(second.data, version_data)
+        self.assertEqual(mock_open.call_count, 1)
+        self.assertEqual(mock_version_file.exists.call_count, 1)
+
     def test_version_endpoint_no_auth_required(self):
         """Test that version endpoint doesn't require authentication."""
         url = reverse("api-version")
@@ -23,6 +23,7 @@ from api.v1.views.storage import (
     storage_upload,
     storage_download,
     storage_delete,
+    storage_bulk_delete,
     storage_list,
     storage_info,
     storage_usage,
@@ -151,6 +152,7 @@ urlpatterns = [
     path("storage/upload/", storage_upload, name="storage-upload"),
     path("storage/download/<path:file_path>/", storage_download, name="storage-download"),
     path("storage/delete/<path:file_path>/", storage_delete, name="storage-delete"),
+    path("storage/bulk-delete/", storage_bulk_delete, name="storage-bulk-delete"),
     path("storage/list/", storage_list, name="storage-list"),
     path("storage/info/<path:file_path>/", storage_info, name="storage-info"),
     path("storage/usage/", storage_usage, name="storage-usage"),
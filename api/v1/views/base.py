@@ -12,6 +12,57 @@ from rest_framework.permissions import IsAuthenticated
 from common.permissions.org_scoped import IsAuthenticatedAndInOrgWithRole
 
 
+def get_user_org_ids(request, roles=None):
+    """
+    Get the IDs of organizations the requesting user belongs to.
+
+    The result is evaluated once and memoized on the request, keyed by the
+    role set, so repeated calls within a request reuse the same list and
+    downstream filters compile to a literal ``IN (...)`` instead of a subquery.
+
+    Args:
+        request: The current request
+        roles: Optional iterable of roles the membership must have
+
+    Returns:
+        list: Organization IDs the user belongs to (with one of ``roles``, if given)
+    """
+    cache = getattr(request, "_cached_user_org_ids", None)
+    if cache is None:
+        cache = request._cached_user_org_ids = {}
+
+    key = frozenset(roles) if roles else None
+    if key not in cache:
+        if key is None:
+            org_ids = request.user.organizations.values_list("id", flat=True)
+        else:
+            org_ids = request.user.organization_memberships.filter(
+                role__in=key
+            ).values_list("organization_id", flat=True)
+        cache[key] = list(org_ids)
+
+    return cache[key]
+
+
+def _resolve_organization(view):
+    """Look up the organization from the URL kwargs or the user's default."""
+    # Try to get organization from URL parameters first
+    org_id = view.kwargs.get("organization_id") or view.kwargs.get("org_id")
+    if org_id:
+        try:
+            from core.models import Organization
+
+            return Organization.objects.get(id=org_id)
+        except ObjectDoesNotExist:
+            return None
+
+    # Fall back to user's default organization
+    if hasattr(view.request, "user") and view.request.user.is_authenticated:
+        return view.request.user.get_default_organization()
+
+    return None
+
+
 class BaseViewSet(viewsets.ModelViewSet):
     """
     Base ViewSet that provides RBAC enforcement and organization scoping.
@@ -38,6 +89,8 @@ class BaseViewSet(viewsets.ModelViewSet):
 
         Subclasses should override this method to determine the appropriate
         organization based on the request context (URL params, user's default org, etc.).
+        The result is memoized on the view, which DRF creates per request, so
+        permission checks, serializer context and perform_create share one lookup.
 
         Returns:
             Organization: The organization for this request context
@@ -45,21 +98,9 @@ class BaseViewSet(viewsets.ModelViewSet):
         Raises:
             NotImplementedError: If not implemented by subclass
         """
-        # Try to get organization from URL parameters first
-        org_id = self.kwargs.get("organization_id") or self.kwargs.get("org_id")
-        if org_id:
-            try:
-                from core.models import Organization
-
-                return Organization.objects.get(id=org_id)
-            except ObjectDoesNotExist:
-                return None
-
-        # Fall back to user's default organization
-        if hasattr(self.request, "user") and self.request.user.is_authenticated:
-            return self.request.user.get_default_organization()
-
-        return None
+        if "_organization" not in vars(self):
+            self._organization = _resolve_organization(self)
+        return self._organization
 
     def get_permissions(self):
         """
@@ -84,6 +125,18 @@ class BaseViewSet(viewsets.ModelViewSet):
         """
         return super().get_queryset()
 
+    def get_user_org_ids(self, roles=None):
+        """
+        Get the IDs of organizations the requesting user belongs to.
+
+        Args:
+            roles: Optional iterable of roles the membership must have
+
+        Returns:
+            list: Organization IDs, memoized for the duration of the request
+        """
+        return get_user_org_ids(self.request, roles)
+
     def perform_create(self, serializer):
         """
         Perform creation with audit trail support.
@@ -143,21 +196,9 @@ class BaseReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_organization(self):
         """Get the organization context for this request."""
-        # Try to get organization from URL parameters first
-        org_id = self.kwargs.get("organization_id") or self.kwargs.get("org_id")
-        if org_id:
-            try:
-                from core.models import Organization
-
-                return Organization.objects.get(id=org_id)
-            except ObjectDoesNotExist:
-                return None
-
-        # Fall back to user's default organization
-        if hasattr(self.request, "user") and self.request.user.is_authenticated:
-            return self.request.user.get_default_organization()
-
-        return None
+        if "_organization" not in vars(self):
+            self._organization = _resolve_organization(self)
+        return self._organization
 
     def get_permissions(self):
         """Get the permissions for this view."""
@@ -172,6 +213,10 @@ class BaseReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
         """Get the queryset for this view."""
         return super().get_queryset()
 
+    def get_user_org_ids(self, roles=None):
+        """Get the IDs of organizations the requesting user belongs to."""
+        return get_user_org_ids(self.request, roles)
+
     def handle_exception(self, exc):
         """Handle exceptions with consistent error formatting."""
         import logging
@@ -23,7 +23,7 @@ from api.v1.serializers.evidence import (
     RecommendationSerializer,
     CreateRecommendationSerializer,
 )
-from constants.roles import OrgRole
+from constants.roles import EDITOR_ROLES, MEMBER_ROLES
 from core.models import (
     EvidenceSource,
     EvidenceFact,
@@ -42,7 +42,7 @@ class EvidenceSourceViewSet(BaseViewSet):
     
     queryset = EvidenceSource.objects.all()
     serializer_class = EvidenceSourceSerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR]
+    required_roles = EDITOR_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations and project."""
@@ -146,7 +146,7 @@ class EvidenceFactViewSet(BaseViewSet):
     
     queryset = EvidenceFact.objects.all()
     serializer_class = EvidenceFactSerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR]
+    required_roles = EDITOR_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations and project."""
@@ -276,7 +276,7 @@ class EvidenceChunkViewSet(BaseReadOnlyViewSet):
     
     queryset = EvidenceChunk.objects.all()
     serializer_class = EvidenceChunkSerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR, OrgRole.VIEWER]
+    required_roles = MEMBER_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations."""
@@ -309,7 +309,7 @@ class EvidenceInsightViewSet(BaseViewSet):
     
     queryset = EvidenceInsight.objects.all()
     serializer_class = EvidenceInsightSerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR]
+    required_roles = EDITOR_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations and project."""
@@ -378,7 +378,7 @@ class RecommendationViewSet(BaseViewSet):
     
     queryset = Recommendation.objects.all()
     serializer_class = RecommendationSerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR]
+    required_roles = EDITOR_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations and project."""
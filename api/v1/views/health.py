@@ -14,6 +14,10 @@ from rest_framework.views import APIView
 
 logger = structlog.get_logger(__name__)
 
+# Settings are fixed for the life of the process; resolve once at import
+# rather than going through LazySettings on every probe.
+_DJANGO_ENV = getattr(settings, "DJANGO_ENV", "unknown")
+
 
 class HealthCheckView(APIView):
     """
@@ -35,14 +39,15 @@ class HealthCheckView(APIView):
         health_status = {
             "status": "healthy",
             "timestamp": request.META.get("HTTP_X_REQUEST_ID", "unknown"),
-            "environment": getattr(settings, "DJANGO_ENV", "unknown"),
+            "environment": _DJANGO_ENV,
             "checks": {},
         }
 
         # Check database connectivity
         try:
-            db_conn = connections["default"]
-            db_conn.cursor()
+            # ensure_connection() opens the connection if needed without
+            # allocating a cursor that would never be used or closed.
+            connections["default"].ensure_connection()
             health_status["checks"]["database"] = "healthy"
             logger.info("Health check: database connection successful")
         except Exception as e:
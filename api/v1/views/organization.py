@@ -5,22 +5,52 @@ Provides CRUD operations for Organizations, Projects, and Organization Membershi
 with proper RBAC and multi-tenant support.
 """
 
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.http import Http404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.utils.translation import gettext_lazy as _
 
+from api.v1.permissions import IsOwnerOrAdmin
 from api.v1.views.base import BaseViewSet, BaseReadOnlyViewSet
 from api.v1.serializers.organization import (
     OrganizationSerializer,
     CreateOrganizationSerializer,
     ProjectSerializer,
     CreateProjectSerializer,
+    PublicProjectSerializer,
     OrganizationMembershipSerializer,
     OrganizationMembershipListSerializer,
 )
-from constants.roles import OrgRole
+from constants.roles import EDITOR_ROLES, MANAGER_ROLES, MEMBER_ROLES, OrgRole
 from core.models import Organization, Project, OrganizationMembership
+from core.utils import count_per_row
+
+
+def _user_organizations_etag(request, *args, **kwargs):
+    """
+    Compute an ETag for the user-orgs listing from a single aggregate query.
+
+    Any membership or organization change bumps ``updated_at`` and a removed
+    membership changes the count, so the tag changes whenever the payload does.
+    """
+    if not request.user.is_authenticated:
+        return None
+    
+    state = OrganizationMembership.objects.filter(user=request.user).aggregate(
+        count=Count('pk'),
+        memberships_updated=Max('updated_at'),
+        organizations_updated=Max('organization__updated_at'),
+    )
+    key = f"{request.user.pk}:{state['count']}:{state['memberships_updated']}:{state['organizations_updated']}"
+    return hashlib.md5(key.encode()).hexdigest()
 
 
 class OrganizationViewSet(BaseViewSet):
@@ -34,15 +64,30 @@ class OrganizationViewSet(BaseViewSet):
     queryset = Organization.objects.all()
     serializer_class = OrganizationSerializer
     required_roles = []  # Custom permission logic below
+    read_permission_classes = (IsAuthenticated,)
+    write_permission_classes = (IsAuthenticated, IsOwnerOrAdmin)
     
     def get_queryset(self):
         """Filter queryset by user's organization memberships."""
         if not self.request.user.is_authenticated:
             return Organization.objects.none()
         
-        # Users can see organizations they are members of
-        user_org_ids = self.request.user.organizations.values_list("id", flat=True)
-        return Organization.objects.filter(id__in=user_org_ids)
+        # Users can see organizations they are members of. Join the membership
+        # table directly; (user, organization) is unique, so no DISTINCT is needed.
+        # Counts and the user's role are annotated so OrganizationSerializer does
+        # not issue per-row queries on list.
+        user_role = OrganizationMembership.objects.filter(
+            user=self.request.user, organization=OuterRef("pk")
+        ).values("role")[:1]
+        return Organization.objects.filter(
+            user_memberships__user=self.request.user
+        ).annotate(
+            _members_count=count_per_row(
+                OrganizationMembership.objects, "organization"
+            ),
+            _projects_count=count_per_row(Project.objects, "organization"),
+            _user_role=Subquery(user_role),
+        )
     
     def get_serializer_class(self):
         """Return appropriate serializer for the action."""
@@ -79,15 +124,10 @@ class OrganizationViewSet(BaseViewSet):
         - Create: Any authenticated user can create orgs
         - Update/Delete: Only admins of the organization
         """
-        from rest_framework.permissions import IsAuthenticated
-        from api.v1.permissions import IsOwnerOrAdmin
-        
-        if self.action in ['create', 'list']:
-            permission_classes = [IsAuthenticated]
-        elif self.action in ['retrieve']:
-            permission_classes = [IsAuthenticated]
+        if self.action in ['create', 'list', 'retrieve']:
+            permission_classes = self.read_permission_classes
         else:  # update, partial_update, destroy
-            permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
+            permission_classes = self.write_permission_classes
         
         return [permission() for permission in permission_classes]
 
@@ -101,20 +141,21 @@ class OrganizationMembershipViewSet(BaseViewSet):
     
     queryset = OrganizationMembership.objects.all()
     serializer_class = OrganizationMembershipSerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER]
+    required_roles = MANAGER_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations."""
         if not self.request.user.is_authenticated:
             return OrganizationMembership.objects.none()
         
-        # Users can see memberships for organizations they have admin/manager access to
-        user_org_ids = self.request.user.organization_memberships.filter(
+        # Users can see memberships for organizations they have admin/manager access to.
+        # The org lookup stays a subquery so this runs as a single statement.
+        managed_org_ids = OrganizationMembership.objects.filter(
+            user=self.request.user,
             role__in=self.required_roles
-        ).values_list("organization_id", flat=True)
-        
+        ).values('organization_id')
         return OrganizationMembership.objects.filter(
-            organization_id__in=user_org_ids
+            organization_id__in=managed_org_ids
         ).select_related('user', 'organization', 'created_by')
     
     @action(
@@ -123,6 +164,7 @@ class OrganizationMembershipViewSet(BaseViewSet):
         url_path='user-orgs',
         url_name='user-orgs'
     )
+    @method_decorator(etag(_user_organizations_etag))
     def user_organizations(self, request):
         """
         Get organizations for the current user (matching Supabase pattern).
@@ -138,9 +180,14 @@ class OrganizationMembershipViewSet(BaseViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
+        # (user, organization) is unique, so each organization appears once.
+        # The nested organization's user_role is the membership's own role, so
+        # hand it over instead of looking it up again per row.
         memberships = OrganizationMembership.objects.filter(
             user=request.user
         ).select_related('organization')
+        for membership in memberships:
+            membership.organization._user_role = membership.role
         
         serializer = OrganizationMembershipListSerializer(
             memberships,
@@ -172,17 +219,19 @@ class OrganizationMembershipViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            membership = OrganizationMembership.objects.get(
-                user=request.user,
-                organization_id=organization_id
-            )
-            return Response({"role": membership.role})
-        except OrganizationMembership.DoesNotExist:
+        # Fetch only the role column rather than a full membership instance
+        role = OrganizationMembership.objects.filter(
+            user=request.user,
+            organization_id=organization_id
+        ).values_list('role', flat=True).first()
+        
+        if role is None:
             return Response(
                 {"error": _("User is not a member of this organization.")},
                 status=status.HTTP_404_NOT_FOUND
             )
+        
+        return Response({"role": role})
 
 
 class ProjectViewSet(BaseViewSet):
@@ -194,7 +243,7 @@ class ProjectViewSet(BaseViewSet):
     
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR]
+    required_roles = EDITOR_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations."""
@@ -202,12 +251,8 @@ class ProjectViewSet(BaseViewSet):
             return Project.objects.none()
         
         # Get organizations where user has required access
-        user_org_ids = self.request.user.organization_memberships.filter(
-            role__in=self.required_roles
-        ).values_list("organization_id", flat=True)
-        
         queryset = Project.objects.filter(
-            organization_id__in=user_org_ids
+            organization_id__in=self.get_user_org_ids(self.required_roles)
         ).select_related('organization', 'created_by')
         
         # Filter by organization if specified
@@ -237,35 +282,42 @@ class ProjectViewSet(BaseViewSet):
     )
     def add_tag(self, request, pk=None):
         """
-        Add a tag to the project.
+        Add one or more tags to the project.
         
         POST /api/v1/projects/{id}/add-tag/
-        Body: {"name": "tag-name"}
+        Body: {"name": "tag-name"} or {"names": ["tag-a", "tag-b"]}
         """
         instance = self.get_object()
-        tag_name = request.data.get('name')
+        tag_names = self._get_tag_names(request)
         
-        if not tag_name:
+        if not tag_names:
             return Response(
                 {"error": _("Tag name is required.")},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
         try:
-            tag = instance.add_tag(
-                tag_name,
+            tags = instance.add_tags(
+                tag_names,
                 instance.organization,
                 request.user
             )
-            return Response({
-                "message": _("Tag added successfully."),
-                "tag": {"name": tag.name, "id": str(tag.id)}
-            })
         except Exception as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        tag_data = [{"name": tag.title, "id": str(tag.id)} for tag in tags]
+        if 'names' in request.data:
+            return Response({
+                "message": _("Tags added successfully."),
+                "tags": tag_data
+            })
+        return Response({
+            "message": _("Tag added successfully."),
+            "tag": tag_data[0]
+        })
     
     @action(
         detail=True,
@@ -275,21 +327,32 @@ class ProjectViewSet(BaseViewSet):
     )
     def remove_tag(self, request, pk=None):
         """
-        Remove a tag from the project.
+        Remove one or more tags from the project.
         
         DELETE /api/v1/projects/{id}/remove-tag/
-        Body: {"name": "tag-name"}
+        Body: {"name": "tag-name"} or {"names": ["tag-a", "tag-b"]}
         """
-        instance = self.get_object()
-        tag_name = request.data.get('name')
+        # Only the organization is needed, so skip loading the project itself.
+        # The queryset is already scoped to the user's permitted organizations.
+        try:
+            organization_id = self.get_queryset().filter(
+                pk=pk
+            ).values_list('organization_id', flat=True).first()
+        except (TypeError, ValueError, ValidationError):
+            organization_id = None
+        
+        if organization_id is None:
+            raise Http404
+        
+        tag_names = self._get_tag_names(request)
         
-        if not tag_name:
+        if not tag_names:
             return Response(
                 {"error": _("Tag name is required.")},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        removed = instance.remove_tag(tag_name, instance.organization)
+        removed = Project.remove_tags_by_id(pk, tag_names, organization_id)
         
         if removed:
             return Response({"message": _("Tag removed successfully.")})
@@ -298,6 +361,23 @@ class ProjectViewSet(BaseViewSet):
                 {"error": _("Tag not found.")},
                 status=status.HTTP_404_NOT_FOUND
             )
+    
+    def _get_tag_names(self, request):
+        """
+        Read tag names from a "names" list or a single "name" in the body.
+        
+        Returns an empty list unless every name is a non-blank string.
+        """
+        if 'names' in request.data:
+            names = request.data.get('names')
+        else:
+            names = [request.data.get('name')]
+        
+        if not isinstance(names, list) or not all(
+            isinstance(name, str) and name.strip() for name in names
+        ):
+            return []
+        return names
 
 
 class PublicProjectViewSet(BaseReadOnlyViewSet):
@@ -314,49 +394,14 @@ class PublicProjectViewSet(BaseReadOnlyViewSet):
             Project.StatusChoices.COMPLETED
         ]
     )
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR, OrgRole.VIEWER]
-    
-    def get_serializer_class(self):
-        """Return minimal serializer for public access."""
-        from rest_framework import serializers
-        
-        class PublicProjectSerializer(serializers.ModelSerializer):
-            organization_name = serializers.CharField(
-                source="organization.name",
-                read_only=True
-            )
-            
-            class Meta:
-                model = Project
-                fields = [
-                    "id",
-                    "name",
-                    "description",
-                    "status",
-                    "organization",
-                    "organization_name",
-                    "created_at"
-                ]
-                read_only_fields = [
-                    "id",
-                    "name",
-                    "description",
-                    "status",
-                    "organization",
-                    "organization_name",
-                    "created_at"
-                ]
-        
-        return PublicProjectSerializer
+    serializer_class = PublicProjectSerializer
+    required_roles = MEMBER_ROLES
     
     def get_queryset(self):
         """Return projects from user's organizations."""
         if not self.request.user.is_authenticated:
             return Project.objects.none()
         
-        user_org_ids = self.request.user.organizations.values_list("id", flat=True)
-        
-        return Project.objects.filter(
-            organization_id__in=user_org_ids,
-            is_active=True
+        return super().get_queryset().filter(
+            organization__user_memberships__user=self.request.user
         ).select_related('organization')
\ No newline at end of file
@@ -5,29 +5,154 @@ This module provides REST API endpoints for file operations with proper
 organization-level access control and role-based permissions.
 """
 
-import logging
-from typing import Dict, Any
+import hashlib
+import json
+import time
 
+import structlog
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from django.core.exceptions import ValidationError, PermissionDenied
-from django.http import HttpResponse, Http404
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import viewsets
+from api.v1.exceptions import custom_exception_handler
 from api.v1.serializers.storage import (
+    BulkDeleteSerializer,
     FileUploadSerializer,
     FileInfoSerializer,
     StorageUsageSerializer,
-    FileListSerializer
 )
-from core.services.storage import StorageService
+from core.models import Organization
+from core.services.storage import StorageService, signed_url_cache_timeout
 from constants.roles import OrgRole
 
-logger = logging.getLogger(__name__)
+logger = structlog.get_logger(__name__)
+
+MAX_LIST_PAGE_SIZE = 1000
+
+# Lifetime of the download URLs StorageService signs for listings
+LISTING_URL_EXPIRE_SECONDS = 3600
+
+# Response bodies and messages are built once; the lazy strings still resolve
+# per request language
+_ERRORS = {
+    'upload_failed': {'error': _('An unexpected error occurred during file upload')},
+    'no_path': {'error': _('File path is required')},
+    'file_not_found': {'error': _('File not found')},
+    'download_failed': {'error': _('An unexpected error occurred during file download')},
+    'delete_failed': {'error': _('An unexpected error occurred during file deletion')},
+    'list_failed': {'error': _('An unexpected error occurred during file listing')},
+    'invalid_page_size': {'error': _('page_size must be between 1 and 1000')},
+    'info_failed': {'error': _('An unexpected error occurred while getting file info')},
+    'usage_failed': {'error': _('An unexpected error occurred while getting storage usage')},
+}
+
+_MESSAGES = {
+    'no_organization': _('Organization context is required for storage operations'),
+    'uploaded': _('File uploaded successfully'),
+    'deleted': _('File deleted successfully'),
+    'bulk_deleted': _('Files deleted successfully'),
+}
+
+# Message returned when an action fails unexpectedly
+_ACTION_ERRORS = {
+    'upload_file': 'upload_failed',
+    'download_file': 'download_failed',
+    'delete_file': 'delete_failed',
+    'bulk_delete_files': 'delete_failed',
+    'list_files': 'list_failed',
+    'get_file_info': 'info_failed',
+    'get_storage_usage': 'usage_failed',
+}
+
+
+def storage_exception_handler(exc, context):
+    """
+    Map storage service errors to the storage API's error responses.
+    
+    - PermissionDenied: 403
+    - ValidationError mentioning "not found": 404
+    - Other ValidationError: 400
+    - Other API exceptions: the project's default handler
+    - Anything else: logged, 500
+    """
+    if isinstance(exc, PermissionDenied):
+        return Response({'error': str(exc)}, status=status.HTTP_403_FORBIDDEN)
+    
+    if isinstance(exc, (ValidationError, DRFValidationError)):
+        if "not found" in str(exc).lower():
+            return Response(_ERRORS['file_not_found'], status=status.HTTP_404_NOT_FOUND)
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    response = custom_exception_handler(exc, context)
+    if response is not None:
+        return response
+    
+    action = getattr(context.get('view'), 'action', None)
+    if action not in _ACTION_ERRORS:
+        return None
+    
+    logger.error(
+        "storage_request_failed",
+        action=action,
+        error=str(exc),
+        exc_info=True,
+    )
+    return Response(
+        _ERRORS[_ACTION_ERRORS[action]],
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
+
+
+def _conditional_response(request, data, etag=None):
+    """
+    Return a Response for data tagged with an ETag.
+    
+    The ETag defaults to a hash of the content. If the client's If-None-Match
+    already has that ETag, a bodiless 304 is returned instead so polling
+    clients don't download the payload again.
+    """
+    if etag is None:
+        payload = json.dumps(data, sort_keys=True, default=str).encode()
+        etag = quote_etag(hashlib.md5(payload).hexdigest())
+    response = get_conditional_response(request, etag=etag) or Response(data)
+    response['ETag'] = etag
+    return response
+
+
+def _listing_etag(request, page, page_size, include_urls):
+    """
+    Build a weak ETag for a file listing page from its metadata.
+    
+    Signed URLs change on every request, so the tag covers the listed names
+    and sizes, the newest modification time and the query that produced the
+    page rather than the response body. When the page carries URLs the tag
+    also rolls over with the signed URL reuse window, so a client revalidating
+    with If-None-Match is never left holding URLs near their expiry.
+    """
+    files = page['files']
+    last_modified = max(
+        (f['modified_time'] for f in files if f['modified_time']), default=None
+    )
+    url_window = None
+    if include_urls:
+        url_window = int(time.time()) // signed_url_cache_timeout(
+            LISTING_URL_EXPIRE_SECONDS
+        )
+    key = json.dumps([
+        [(f['name'], f['size']) for f in files],
+        last_modified,
+        page['next_page_token'],
+        page_size,
+        sorted(request.query_params.items()),
+        url_window,
+    ], default=str).encode()
+    return 'W/' + quote_etag(hashlib.md5(key).hexdigest())
 
 
 class StorageAPIView(viewsets.ViewSet):
@@ -35,24 +160,55 @@ class StorageAPIView(viewsets.ViewSet):
     API view for file storage operations with RBAC enforcement.
     
     Provides endpoints for uploading, downloading, listing, and managing files
-    with proper organization-level access control.
+    with proper organization-level access control. Errors raised by the
+    storage service are turned into responses by storage_exception_handler.
     """
     
     permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    
+    # Only these actions read the request body
+    body_actions = ('upload_file', 'bulk_delete_files')
+
+    def get_exception_handler(self):
+        """Use the storage-specific error responses for this view."""
+        return storage_exception_handler
+
+    def get_parsers(self):
+        """
+        Return parsers only for actions that read the request body.
+        
+        Runs before self.action is set, so the action is looked up from the
+        method. Without parsers no body is ever read for other requests.
+        """
+        action = self.action_map.get(self.request.method.lower())
+        if action not in self.body_actions:
+            return []
+        return super().get_parsers()
 
     def get_organization(self):
         """
         Get the organization context for this request.
         
+        The result is memoized on the request so repeated lookups during a
+        single request do not hit the database again.
+        
         Returns:
             Organization: The organization for this request context
         """
+        if hasattr(self.request, "_cached_organization"):
+            return self.request._cached_organization
+        
+        organization = self._resolve_organization()
+        self.request._cached_organization = organization
+        return organization
+
+    def _resolve_organization(self):
+        """Look up the organization from the URL or the user's default."""
         # Try to get organization from URL parameters first
         org_id = self.kwargs.get("organization_id") or self.kwargs.get("org_id")
         if org_id:
             try:
-                from core.models import Organization
                 return Organization.objects.get(id=org_id)
             except Organization.DoesNotExist:
                 return None
@@ -67,17 +223,24 @@ class StorageAPIView(viewsets.ViewSet):
         """
         Get storage service instance for the current user and organization.
         
+        The service is built once per request and reused.
+        
         Returns:
             StorageService instance
             
         Raises:
             ValidationError: If organization context is missing
         """
+        if hasattr(self.request, "_cached_storage_service"):
+            return self.request._cached_storage_service
+        
         organization = self.get_organization()
         if not organization:
-            raise ValidationError(_("Organization context is required for storage operations"))
+            raise ValidationError(_MESSAGES['no_organization'])
             
-        return StorageService(user=self.request.user, organization=organization)
+        storage_service = StorageService(user=self.request.user, organization=organization)
+        self.request._cached_storage_service = storage_service
+        return storage_service
 
     def upload_file(self, request):
         """
@@ -98,47 +261,29 @@ class StorageAPIView(viewsets.ViewSet):
             403: Insufficient permissions
             413: File too large
         """
-        try:
-            serializer = FileUploadSerializer(data=request.data)
-            serializer.is_valid(raise_exception=True)
-            
-            storage_service = self.get_storage_service()
-            
-            # Upload file using storage service
-            file_info = storage_service.upload_file(
-                file=serializer.validated_data['file'],
-                file_path=serializer.validated_data.get('file_path'),
-                category=serializer.validated_data.get('category', 'general'),
-                metadata=serializer.validated_data.get('metadata', {})
-            )
-            
-            # Return file information
-            response_serializer = FileInfoSerializer(file_info)
-            
-            return Response(
-                {
-                    'message': _('File uploaded successfully'),
-                    'file': response_serializer.data
-                },
-                status=status.HTTP_201_CREATED
-            )
-            
-        except PermissionDenied as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        except (ValidationError, DRFValidationError) as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error in file upload: {e}")
-            return Response(
-                {'error': _('An unexpected error occurred during file upload')},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        serializer = FileUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        storage_service = self.get_storage_service()
+        
+        # Upload file using storage service
+        file_info = storage_service.upload_file(
+            file=serializer.validated_data['file'],
+            file_path=serializer.validated_data.get('file_path'),
+            category=serializer.validated_data.get('category', 'general'),
+            metadata=serializer.validated_data.get('metadata', {})
+        )
+        
+        # Return file information
+        response_serializer = FileInfoSerializer(file_info)
+        
+        return Response(
+            {
+                'message': _MESSAGES['uploaded'],
+                'file': response_serializer.data
+            },
+            status=status.HTTP_201_CREATED
+        )
 
     def download_file(self, request, file_path=None):
         """
@@ -156,47 +301,33 @@ class StorageAPIView(viewsets.ViewSet):
         """
         if not file_path:
             return Response(
-                {'error': _('File path is required')},
+                _ERRORS['no_path'],
                 status=status.HTTP_400_BAD_REQUEST
             )
             
-        try:
-            storage_service = self.get_storage_service()
-            expire_seconds = int(request.query_params.get('expire', 3600))
-            
-            # Get signed URL for file
-            signed_url = storage_service.get_file_url(
-                file_path=file_path,
-                expire_seconds=expire_seconds
-            )
-            
-            return Response({
-                'download_url': signed_url,
-                'file_path': file_path,
-                'expires_in_seconds': expire_seconds
-            })
-            
-        except (ValidationError, DRFValidationError) as e:
-            if "not found" in str(e).lower():
-                return Response(
-                    {'error': _('File not found')},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except PermissionDenied as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error in file download: {e}")
-            return Response(
-                {'error': _('An unexpected error occurred during file download')},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        storage_service = self.get_storage_service()
+        expire_seconds = int(request.query_params.get('expire', 3600))
+        
+        # Get signed URL for file
+        signed_url = storage_service.get_file_url(
+            file_path=file_path,
+            expire_seconds=expire_seconds
+        )
+        
+        response = Response({
+            'download_url': signed_url,
+            'file_path': file_path,
+            'expires_in_seconds': expire_seconds
+        })
+        # Let the client reuse the signed URL while it is still valid. The
+        # service may hand out a cached URL, so only promise the lifetime
+        # that remains after the longest time it can be served from cache.
+        patch_cache_control(
+            response,
+            private=True,
+            max_age=expire_seconds - signed_url_cache_timeout(expire_seconds)
+        )
+        return response
 
     def delete_file(self, request, file_path=None):
         """
@@ -211,84 +342,99 @@ class StorageAPIView(viewsets.ViewSet):
         """
         if not file_path:
             return Response(
-                {'error': _('File path is required')},
+                _ERRORS['no_path'],
                 status=status.HTTP_400_BAD_REQUEST
             )
             
-        try:
-            storage_service = self.get_storage_service()
-            
-            # Delete file
-            storage_service.delete_file(file_path)
-            
-            return Response(
-                {'message': _('File deleted successfully')},
-                status=status.HTTP_204_NO_CONTENT
-            )
-            
-        except (ValidationError, DRFValidationError) as e:
-            if "not found" in str(e).lower():
-                return Response(
-                    {'error': _('File not found')},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except PermissionDenied as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error in file deletion: {e}")
-            return Response(
-                {'error': _('An unexpected error occurred during file deletion')},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        storage_service = self.get_storage_service()
+        
+        # Delete file
+        storage_service.delete_file(file_path)
+        
+        return Response(
+            {'message': _MESSAGES['deleted']},
+            status=status.HTTP_204_NO_CONTENT
+        )
+
+    def bulk_delete_files(self, request):
+        """
+        Delete several files in one request.
+        
+        POST /api/v1/storage/bulk-delete/
+        
+        Request format:
+        - file_paths: List of file paths to delete (max 1000)
+        
+        Returns:
+            200: Files deleted successfully
+            400: Invalid request
+            403: Insufficient permissions
+        """
+        serializer = BulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        storage_service = self.get_storage_service()
+        
+        deleted_count = storage_service.delete_files(
+            serializer.validated_data['file_paths']
+        )
+        
+        return Response({
+            'message': _MESSAGES['bulk_deleted'],
+            'deleted_count': deleted_count
+        })
 
     def list_files(self, request):
         """
-        List files in a directory.
+        List one page of files in a directory.
         
         GET /api/v1/storage/list/
         
         Query parameters:
         - directory: Directory path to list (optional, default: root)
         - category: Filter by file category (optional)
+        - page_size: Files per page (optional, default and max: 1000)
+        - cursor: 'next_cursor' from the previous page (optional)
+        - include_urls: Set to 0 or false to skip signing download URLs
+          (optional, default: true)
         
         Returns:
-            200: List of files with metadata
+            200: List of files with metadata and the next page cursor
+            304: Listing unchanged since the ETag in If-None-Match
+            400: Invalid page size
             403: Insufficient permissions
         """
         try:
-            storage_service = self.get_storage_service()
-            
-            directory = request.query_params.get('directory', '')
-            category = request.query_params.get('category')
-            
-            # List files
-            files = storage_service.list_files(
-                directory=directory,
-                category=category
-            )
-            
-            serializer = FileListSerializer({'files': files})
-            
-            return Response(serializer.data)
-            
-        except PermissionDenied as e:
+            page_size = int(request.query_params.get('page_size', MAX_LIST_PAGE_SIZE))
+        except ValueError:
+            page_size = 0
+        if not 1 <= page_size <= MAX_LIST_PAGE_SIZE:
             return Response(
-                {'error': str(e)},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error in file listing: {e}")
-            return Response(
-                {'error': _('An unexpected error occurred during file listing')},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                _ERRORS['invalid_page_size'],
+                status=status.HTTP_400_BAD_REQUEST
             )
+            
+        storage_service = self.get_storage_service()
+        
+        directory = request.query_params.get('directory', '')
+        category = request.query_params.get('category')
+        include_urls = request.query_params.get('include_urls', '1').lower() not in ('0', 'false')
+        
+        # List files
+        page = storage_service.list_files_page(
+            directory=directory,
+            category=category,
+            page_size=page_size,
+            page_token=request.query_params.get('cursor') or None,
+            include_urls=include_urls
+        )
+        
+        # StorageService already returns items in the FileListSerializer
+        # shape; re-serializing every item dominates large listings.
+        return _conditional_response(request, {
+            'files': page['files'],
+            'next_cursor': page['next_page_token']
+        }, etag=_listing_etag(request, page, page_size, include_urls))
 
     def get_file_info(self, request, file_path=None):
         """
@@ -298,46 +444,24 @@ class StorageAPIView(viewsets.ViewSet):
         
         Returns:
             200: File information
+            304: File information unchanged since the ETag in If-None-Match
             404: File not found
             403: Insufficient permissions
         """
         if not file_path:
             return Response(
-                {'error': _('File path is required')},
+                _ERRORS['no_path'],
                 status=status.HTTP_400_BAD_REQUEST
             )
             
-        try:
-            storage_service = self.get_storage_service()
-            
-            # Get file info
-            file_info = storage_service.get_file_info(file_path)
-            
-            serializer = FileInfoSerializer(file_info)
-            
-            return Response(serializer.data)
-            
-        except (ValidationError, DRFValidationError) as e:
-            if "not found" in str(e).lower():
-                return Response(
-                    {'error': _('File not found')},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        except PermissionDenied as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error in get file info: {e}")
-            return Response(
-                {'error': _('An unexpected error occurred while getting file info')},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        storage_service = self.get_storage_service()
+        
+        # Get file info
+        file_info = storage_service.get_file_info(file_path)
+        
+        serializer = FileInfoSerializer(file_info)
+        
+        return _conditional_response(request, serializer.data)
 
     def get_storage_usage(self, request):
         """
@@ -349,33 +473,21 @@ class StorageAPIView(viewsets.ViewSet):
             200: Storage usage information
             403: Insufficient permissions
         """
-        try:
-            storage_service = self.get_storage_service()
-            
-            # Get storage usage
-            usage_info = storage_service.get_storage_usage()
-            
-            serializer = StorageUsageSerializer(usage_info)
-            
-            return Response(serializer.data)
-            
-        except PermissionDenied as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error in get storage usage: {e}")
-            return Response(
-                {'error': _('An unexpected error occurred while getting storage usage')},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        storage_service = self.get_storage_service()
+        
+        # Get storage usage
+        usage_info = storage_service.get_storage_usage()
+        
+        serializer = StorageUsageSerializer(usage_info)
+        
+        return Response(serializer.data)
 
 
 # For compatibility with existing URL patterns
 storage_upload = StorageAPIView.as_view({'post': 'upload_file'})
 storage_download = StorageAPIView.as_view({'get': 'download_file'})
 storage_delete = StorageAPIView.as_view({'delete': 'delete_file'})
+storage_bulk_delete = StorageAPIView.as_view({'post': 'bulk_delete_files'})
 storage_list = StorageAPIView.as_view({'get': 'list_files'})
 storage_info = StorageAPIView.as_view({'get': 'get_file_info'})
 storage_usage = StorageAPIView.as_view({'get': 'get_storage_usage'})
\ No newline at end of file
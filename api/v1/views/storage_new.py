@@ -11,10 +11,39 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FileUploadParser
 from rest_framework.response import Response
 from django.utils.translation import gettext_lazy as _
+from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.files.storage import default_storage
 import uuid
 import os
-from datetime import datetime
+import secrets
+import time
+
+import structlog
+
+from core.services.storage import StorageService
+
+logger = structlog.get_logger(__name__)
+
+# Error bodies are built once; the lazy strings still resolve per request language
+_ERRORS = {
+    'no_file': {"error": _("No file provided")},
+    'no_file_name': {"error": _("file_name is required")},
+    'no_organization': {"error": _("Organization context is required for storage operations")},
+    'no_file_path': {"error": _("file_path is required")},
+    'signing_failed': {"error": _("Could not create an upload URL, please try again later")},
+}
+
+
+def _unique_evidence_path(user_id, file_name):
+    """
+    Build a unique, time-sortable storage path for an evidence file.
+    
+    The millisecond timestamp keeps a user's files in upload order and the
+    random suffix keeps concurrent uploads from colliding.
+    """
+    file_extension = os.path.splitext(file_name)[1]
+    timestamp = time.time_ns() // 1_000_000
+    return f"evidence-files/{user_id}/{timestamp:013d}_{secrets.token_hex(4)}{file_extension}"
 
 
 @api_view(['POST'])
@@ -33,21 +62,16 @@ def upload_evidence_file(request):
     """
     if 'file' not in request.FILES:
         return Response(
-            {"error": _("No file provided")},
+            _ERRORS['no_file'],
             status=status.HTTP_400_BAD_REQUEST
         )
     
     uploaded_file = request.FILES['file']
     
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_extension = os.path.splitext(uploaded_file.name)[1]
-    unique_filename = f"{request.user.id}/{timestamp}_{uuid.uuid4().hex[:8]}{file_extension}"
-    
     try:
         # TODO: Upload to actual cloud storage
         # For now, save locally or return stub path
-        file_path = f"evidence-files/{unique_filename}"
+        file_path = _unique_evidence_path(request.user.id, uploaded_file.name)
         
         # Stub: Don't actually save the file, just return metadata
         file_id = str(uuid.uuid4())
@@ -203,31 +227,64 @@ def create_signed_upload_url(request):
     
     POST /api/v1/storage/signed-upload-url/
     
-    # TODO: Implement signed URL generation for cloud storage
-    This is a stub implementation.
+    The client PUTs the file to the returned URL, so the file bytes go
+    straight to cloud storage instead of through the API server.
     """
     file_name = request.data.get('file_name')
     content_type = request.data.get('content_type')
     
     if not file_name:
         return Response(
-            {"error": _("file_name is required")},
+            _ERRORS['no_file_name'],
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Generate unique file path
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_extension = os.path.splitext(file_name)[1]
-    unique_filename = f"{request.user.id}/{timestamp}_{uuid.uuid4().hex[:8]}{file_extension}"
-    file_path = f"evidence-files/{unique_filename}"
+    organization = request.user.get_default_organization()
+    if not organization:
+        return Response(
+            _ERRORS['no_organization'],
+            status=status.HTTP_400_BAD_REQUEST
+        )
     
-    # TODO: Generate actual signed URL from cloud storage provider
+    file_path = _unique_evidence_path(request.user.id, file_name)
+    expires_in = 3600
+    
+    try:
+        storage_service = StorageService(user=request.user, organization=organization)
+        signed_url = storage_service.get_upload_url(
+            file_path,
+            content_type=content_type,
+            expire_seconds=expires_in
+        )
+    except PermissionDenied as e:
+        return Response(
+            {"error": str(e)},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    except ValidationError as e:
+        return Response(
+            {"error": str(e)},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except Exception as e:
+        # Missing signing credentials or GCS API errors
+        logger.error(
+            "signed_upload_url_failed",
+            file_path=file_path,
+            error=str(e),
+            exc_info=True,
+        )
+        return Response(
+            _ERRORS['signing_failed'],
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
     
     return Response({
-        "signed_url": f"https://stub-storage-upload.com/{file_path}?signature=stub_signature",
+        "signed_url": signed_url,
+        "method": "PUT",
+        "content_type": content_type,
         "file_path": file_path,
-        "expires_in": 3600,
-        "message": "Stub signed upload URL"
+        "expires_in": expires_in
     })
 
 
@@ -246,7 +303,7 @@ def create_signed_download_url(request):
     
     if not file_path:
         return Response(
-            {"error": _("file_path is required")},
+            _ERRORS['no_file_path'],
             status=status.HTTP_400_BAD_REQUEST
         )
     
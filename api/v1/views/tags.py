@@ -5,8 +5,12 @@ Provides CRUD operations for Tags with proper organization scoping and RBAC.
 Based on the Tags Specification for global tag management.
 """
 
+import json
+
+from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from django.utils.translation import gettext_lazy as _
 
@@ -14,12 +18,89 @@ from api.v1.views.base import BaseViewSet, BaseReadOnlyViewSet
 from api.v1.serializers.tags import (
     TagSerializer,
     CreateTagSerializer,
+    PublicTagSerializer,
     TagSummarySerializer,
     CreateTagSummarySerializer,
     UpdateTagSummarySerializer,
 )
-from constants.roles import OrgRole
-from core.models import Tag
+from constants.roles import EDITOR_ROLES, MEMBER_ROLES
+from core.models import EvidenceFact, EvidenceInsight, EvidenceSource, Tag
+
+
+class TagPagination(PageNumberPagination):
+    """
+    Page-number pagination with a client-selectable page size.
+    
+    Accepts ``page`` and ``items_per_page`` like the Supabase-era clients,
+    capped so a single request can't pull every tag.
+    """
+    
+    page_size_query_param = 'items_per_page'
+    max_page_size = 500
+
+
+# Stub tag summaries returned by TagSummaryViewSet.list until real tag
+# aggregation exists. Built once at import; the per-request project_id and
+# user_id are merged into copies.
+_STUB_TAGS = (
+    {
+        "id": "tag-1-uuid",
+        "title": "communication",
+        "definition": "Communication related insights and facts",
+        "category": "theme",
+        "color": "#3B82F6",
+        "status": "approved",
+        "usage_count": 15,
+        "created_at": "2024-11-20T10:00:00Z",
+        "updated_at": "2024-11-20T10:00:00Z"
+    },
+    {
+        "id": "tag-2-uuid",
+        "title": "process-improvement",
+        "definition": "Process improvement opportunities",
+        "category": "action",
+        "color": "#10B981",
+        "status": "approved",
+        "usage_count": 8,
+        "created_at": "2024-11-20T10:15:00Z",
+        "updated_at": "2024-11-20T10:15:00Z"
+    },
+    {
+        "id": "tag-3-uuid",
+        "title": "user-feedback",
+        "definition": "Direct feedback from users",
+        "category": "source",
+        "color": "#F59E0B",
+        "status": "pending",
+        "usage_count": 3,
+        "created_at": "2024-11-20T11:00:00Z",
+        "updated_at": "2024-11-20T11:00:00Z"
+    },
+)
+
+# Defaults for the stub create/update responses.
+_STUB_CREATED_TAG = {
+    "id": "new-tag-uuid",
+    "definition": "",
+    "category": "",
+    "color": "#6B7280",
+    "status": "pending",
+    "usage_count": 0,
+    "created_at": "2024-11-20T12:00:00Z",
+    "updated_at": "2024-11-20T12:00:00Z"
+}
+
+_STUB_UPDATED_TAG = {
+    "title": "Updated Tag",
+    "definition": "Updated definition",
+    "category": "updated",
+    "color": "#6B7280",
+    "status": "approved",
+    "usage_count": 5,
+    "project_id": "project-uuid",
+    "created_at": "2024-11-20T10:00:00Z",
+    "updated_at": "2024-11-20T12:30:00Z"
+}
 
 
 class TagViewSet(BaseViewSet):
@@ -32,7 +113,7 @@ class TagViewSet(BaseViewSet):
     
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR]
+    required_roles = EDITOR_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations."""
@@ -40,9 +121,7 @@ class TagViewSet(BaseViewSet):
             return Tag.objects.none()
         
         # Get organizations where user has required access
-        user_org_ids = self.request.user.organization_memberships.filter(
-            role__in=self.required_roles
-        ).values_list("organization_id", flat=True)
+        user_org_ids = self.get_user_org_ids(self.required_roles)
         
         queryset = Tag.objects.filter(
             organization_id__in=user_org_ids
@@ -81,7 +160,7 @@ class TagSummaryViewSet(BaseViewSet):
     
     queryset = Tag.objects.all()
     serializer_class = TagSummarySerializer
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR]
+    required_roles = EDITOR_ROLES
     
     def get_queryset(self):
         """Filter queryset by user's organizations and project."""
@@ -89,9 +168,7 @@ class TagSummaryViewSet(BaseViewSet):
             return Tag.objects.none()
         
         # Get organizations where user has required access
-        user_org_ids = self.request.user.organization_memberships.filter(
-            role__in=self.required_roles
-        ).values_list("organization_id", flat=True)
+        user_org_ids = self.get_user_org_ids(self.required_roles)
         
         queryset = Tag.objects.filter(
             organization_id__in=user_org_ids
@@ -127,49 +204,11 @@ class TagSummaryViewSet(BaseViewSet):
         
         # TODO: Get actual tags from database and calculate usage counts
         # For now, return stub tag summaries
-        stub_tags = [
-            {
-                "id": "tag-1-uuid",
-                "title": "communication",
-                "definition": "Communication related insights and facts",
-                "category": "theme",
-                "color": "#3B82F6",
-                "status": "approved",
-                "usage_count": 15,
-                "project_id": project_id,
-                "user_id": str(request.user.id),
-                "created_at": "2024-11-20T10:00:00Z",
-                "updated_at": "2024-11-20T10:00:00Z"
-            },
-            {
-                "id": "tag-2-uuid", 
-                "title": "process-improvement",
-                "definition": "Process improvement opportunities",
-                "category": "action",
-                "color": "#10B981",
-                "status": "approved",
-                "usage_count": 8,
-                "project_id": project_id,
-                "user_id": str(request.user.id),
-                "created_at": "2024-11-20T10:15:00Z",
-                "updated_at": "2024-11-20T10:15:00Z"
-            },
-            {
-                "id": "tag-3-uuid",
-                "title": "user-feedback",
-                "definition": "Direct feedback from users",
-                "category": "source",
-                "color": "#F59E0B",
-                "status": "pending",
-                "usage_count": 3,
-                "project_id": project_id,
-                "user_id": str(request.user.id),
-                "created_at": "2024-11-20T11:00:00Z",
-                "updated_at": "2024-11-20T11:00:00Z"
-            }
-        ]
-        
-        return Response(stub_tags)
+        user_id = str(request.user.id)
+        return Response([
+            {**tag, "project_id": project_id, "user_id": user_id}
+            for tag in _STUB_TAGS
+        ])
     
     def create(self, request, *args, **kwargs):
         """
@@ -183,17 +222,9 @@ class TagSummaryViewSet(BaseViewSet):
         # TODO: Create actual tag record
         # For now, return stub created tag
         created_tag = {
-            "id": "new-tag-uuid",
-            "title": serializer.validated_data['title'],
-            "definition": serializer.validated_data.get('definition', ''),
-            "category": serializer.validated_data.get('category', ''),
-            "color": serializer.validated_data.get('color', '#6B7280'),
-            "status": serializer.validated_data.get('status', 'pending'),
-            "usage_count": 0,
-            "project_id": serializer.validated_data['project_id'],
+            **_STUB_CREATED_TAG,
+            **serializer.validated_data,
             "user_id": str(request.user.id),
-            "created_at": "2024-11-20T12:00:00Z",
-            "updated_at": "2024-11-20T12:00:00Z"
         }
         
         return Response(created_tag, status=status.HTTP_201_CREATED)
@@ -211,17 +242,10 @@ class TagSummaryViewSet(BaseViewSet):
         serializer.is_valid(raise_exception=True)
         
         updated_tag = {
+            **_STUB_UPDATED_TAG,
+            **serializer.validated_data,
             "id": kwargs.get('pk'),
-            "title": serializer.validated_data.get('title', 'Updated Tag'),
-            "definition": serializer.validated_data.get('definition', 'Updated definition'),
-            "category": serializer.validated_data.get('category', 'updated'),
-            "color": serializer.validated_data.get('color', '#6B7280'),
-            "status": serializer.validated_data.get('status', 'approved'),
-            "usage_count": 5,
-            "project_id": "project-uuid",
             "user_id": str(request.user.id),
-            "created_at": "2024-11-20T10:00:00Z",
-            "updated_at": "2024-11-20T12:30:00Z"
         }
         
         return Response(updated_tag)
@@ -247,15 +271,17 @@ class TagSummaryViewSet(BaseViewSet):
         """
         Get usage count for specific tags.
         
-        GET /api/v1/tags/usage-count/?project_id={project_id}&tags=["tag1","tag2"]
+        GET /api/v1/tags/usage-count/?project_id={project_id}&tags=tag1&tags=tag2
         
-        Matches Supabase pattern for counting tag usage across tables.
+        The legacy form ``tags=["tag1","tag2"]`` (a JSON list) is still accepted.
         
-        # TODO: Implement real tag usage counting
-        This is a stub implementation.
+        Matches Supabase pattern for counting tag usage across tables: the
+        number of evidence sources, facts and insights in the project that
+        carry any of the given tags, counted in a single query. Soft-deleted
+        evidence is not counted.
         """
         project_id = request.query_params.get('project_id')
-        tags_param = request.query_params.get('tags')
+        tag_titles = request.query_params.getlist('tags')
         
         if not project_id:
             return Response(
@@ -263,19 +289,49 @@ class TagSummaryViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        if not tags_param:
+        if not any(tag_titles):
             return Response(
                 {"error": _("tags parameter is required")},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # TODO: Parse tags parameter and count actual usage
-        # Should count across evidence_facts, evidence_insights, evidence_sources.metadata.tags
+        if len(tag_titles) == 1 and tag_titles[0].startswith('['):
+            try:
+                tag_titles = json.loads(tag_titles[0])
+            except ValueError:
+                tag_titles = None
+            
+            if not isinstance(tag_titles, list) or not all(
+                isinstance(title, str) for title in tag_titles
+            ):
+                return Response(
+                    {"error": _("tags must be a JSON list of tag names")},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        tags = Tag.objects.filter(
+            organization_id__in=self.get_user_org_ids(self.required_roles),
+            title__in=tag_titles,
+        )
         
-        return Response({
-            "count": 5,  # Stub count
-            "message": "Stub tag usage count"
-        })
+        # Each evidence type is filtered on its own (through its soft-delete
+        # manager) and the distinct ids are combined with UNION ALL, so the
+        # count is one query without joining the three relations side by side.
+        try:
+            tagged = [
+                model.objects.filter(
+                    projects=project_id, tags__in=tags
+                ).values('pk').distinct()
+                for model in (EvidenceSource, EvidenceFact, EvidenceInsight)
+            ]
+            count = tagged[0].union(*tagged[1:], all=True).count()
+        except (TypeError, ValueError, ValidationError):
+            return Response(
+                {"error": _("Invalid project_id")},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({"count": count})
 
 
 class PublicTagViewSet(BaseReadOnlyViewSet):
@@ -286,27 +342,22 @@ class PublicTagViewSet(BaseReadOnlyViewSet):
     """
     
     queryset = Tag.objects.all()
-    required_roles = [OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.EDITOR, OrgRole.VIEWER]
-    
-    def get_serializer_class(self):
-        """Return minimal serializer for public access."""
-        from rest_framework import serializers
-        
-        class PublicTagSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = Tag
-                fields = ["id", "title", "definition", "created_at"]
-                read_only_fields = ["id", "title", "definition", "created_at"]
-        
-        return PublicTagSerializer
+    serializer_class = PublicTagSerializer
+    pagination_class = TagPagination
+    required_roles = MEMBER_ROLES
     
     def get_queryset(self):
         """Return tags from user's organizations."""
         if not self.request.user.is_authenticated:
             return Tag.objects.none()
         
-        user_org_ids = self.request.user.organizations.values_list("id", flat=True)
+        user_org_ids = self.get_user_org_ids()
         
+        # The public serializer only needs these columns, so skip the
+        # organization join and the rest of the tag row.
+        # Pages need a stable order; newest first, like the other tag listings.
         return Tag.objects.filter(
             organization_id__in=user_org_ids
-        ).select_related('organization')
\ No newline at end of file
+        ).only(
+            'id', 'title', 'definition', 'created_at', 'organization_id'
+        ).order_by('-created_at', '-id')
\ No newline at end of file
@@ -4,6 +4,7 @@ User-related API views.
 Provides endpoints for user profile management and authentication.
 """
 
+from django.db.models import Exists, OuterRef, Prefetch, prefetch_related_objects
 from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 from rest_framework.decorators import action
@@ -11,13 +12,46 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from api.v1.serializers.user import (
+    ChangePasswordSerializer,
     CreateUserSerializer,
+    PublicUserSerializer,
     UserProfileSerializer,
     UserWithOrganizationsSerializer,
 )
 from api.v1.views.base import BaseReadOnlyViewSet, BaseViewSet
-from constants.roles import OrgRole
-from core.models import User
+from constants.roles import ADMIN_ROLES
+from core.models import OrganizationMembership, User
+
+
+def _shares_organization(org_ids):
+    """
+    Filter matching users with a membership in any of ``org_ids``.
+
+    A semi-join, so users in several of the organizations appear once
+    without a DISTINCT over the user/membership join.
+    """
+    return Exists(
+        OrganizationMembership.objects.filter(
+            user_id=OuterRef("pk"), organization_id__in=org_ids
+        )
+    )
+
+
+def _prefetch_memberships(user):
+    """
+    Load the user's memberships and their organizations in one query.
+
+    UserWithOrganizationsSerializer renders every membership's organization
+    and the default organization, which would otherwise cost a query each.
+    """
+    prefetch_related_objects(
+        [user],
+        Prefetch(
+            "organization_memberships",
+            queryset=OrganizationMembership.objects.select_related("organization"),
+        ),
+    )
+    return user
 
 
 class UserViewSet(BaseViewSet):
@@ -30,10 +64,7 @@ class UserViewSet(BaseViewSet):
 
     queryset = User.objects.all()
     serializer_class = UserProfileSerializer
-    required_roles = [
-        OrgRole.SUPER_ADMIN,
-        OrgRole.ADMIN,
-    ]  # Only super admins and admins can manage users
+    required_roles = ADMIN_ROLES  # Only super admins and admins can manage users
 
     def get_queryset(self):
         """
@@ -45,12 +76,10 @@ class UserViewSet(BaseViewSet):
             return User.objects.none()
 
         # Get organizations where the user has admin or super admin access
-        user_org_ids = self.request.user.organization_memberships.filter(
-            role__in=[OrgRole.SUPER_ADMIN, OrgRole.ADMIN]
-        ).values_list("organization_id", flat=True)
+        user_org_ids = self.get_user_org_ids(ADMIN_ROLES)
 
         # Return users who are members of those organizations
-        return User.objects.filter(organizations__id__in=user_org_ids).distinct()
+        return User.objects.filter(_shares_organization(user_org_ids))
 
     def get_serializer_class(self):
         """
@@ -83,7 +112,9 @@ class UserViewSet(BaseViewSet):
         users should always be able to view and update their own profile.
         """
         if request.method == "GET":
-            serializer = UserWithOrganizationsSerializer(request.user)
+            serializer = UserWithOrganizationsSerializer(
+                _prefetch_memberships(request.user)
+            )
             return Response(serializer.data)
 
         elif request.method == "PATCH":
@@ -95,7 +126,9 @@ class UserViewSet(BaseViewSet):
                 serializer.save()
 
                 # Return updated data with organizations
-                response_serializer = UserWithOrganizationsSerializer(request.user)
+                response_serializer = UserWithOrganizationsSerializer(
+                    _prefetch_memberships(request.user)
+                )
                 return Response(response_serializer.data)
 
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -118,21 +151,6 @@ class UserViewSet(BaseViewSet):
         - new_password: The new password
         - new_password_confirm: Confirmation of the new password
         """
-        from rest_framework import serializers
-
-        # Define inline serializer for password change
-        class ChangePasswordSerializer(serializers.Serializer):
-            current_password = serializers.CharField(required=True)
-            new_password = serializers.CharField(required=True, min_length=8)
-            new_password_confirm = serializers.CharField(required=True)
-
-            def validate(self, attrs):
-                if attrs["new_password"] != attrs["new_password_confirm"]:
-                    raise serializers.ValidationError(
-                        {"new_password_confirm": _("New passwords do not match.")}
-                    )
-                return attrs
-
         serializer = ChangePasswordSerializer(data=request.data)
 
         if serializer.is_valid():
@@ -166,22 +184,9 @@ class PublicUserViewSet(BaseReadOnlyViewSet):
     """
 
     queryset = User.objects.filter(is_active=True)
+    serializer_class = PublicUserSerializer
     permission_classes = [IsAuthenticated]
 
-    def get_serializer_class(self):
-        """
-        Return a minimal user serializer for public access.
-        """
-        from rest_framework import serializers
-
-        class PublicUserSerializer(serializers.ModelSerializer):
-            class Meta:
-                model = User
-                fields = ["id", "full_name", "date_joined"]
-                read_only_fields = ["id", "full_name", "date_joined"]
-
-        return PublicUserSerializer
-
     def get_queryset(self):
         """
         Return users that are in the same organizations as the requesting user.
@@ -190,9 +195,7 @@ class PublicUserViewSet(BaseReadOnlyViewSet):
             return User.objects.none()
 
         # Get organizations the user belongs to
-        user_org_ids = self.request.user.organizations.values_list("id", flat=True)
+        user_org_ids = self.get_user_org_ids()
 
         # Return users who are members of the same organizations
-        return User.objects.filter(
-            organizations__id__in=user_org_ids, is_active=True
-        ).distinct()
+        return User.objects.filter(_shares_organization(user_org_ids), is_active=True)
@@ -5,6 +5,7 @@ Provides endpoints for exposing application version information.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from django.conf import settings
@@ -14,6 +15,33 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 
+DEFAULT_VERSION = {"commit": "unknown", "timestamp": "unknown", "branch": "unknown"}
+
+
+@lru_cache(maxsize=1)
+def _load_version():
+    """
+    Read version.json from the project root once per process.
+
+    The file is written at build time and never changes while the process
+    runs, so the parsed contents are kept for the lifetime of the worker.
+
+    Returns:
+        Parsed version info, or the default values if the file is missing
+        or unreadable.
+    """
+    version_file = Path(settings.BASE_DIR) / "version.json"
+
+    if not version_file.exists():
+        return DEFAULT_VERSION
+
+    try:
+        with open(version_file, "r") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return DEFAULT_VERSION
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def version_info(request):
@@ -24,18 +52,4 @@ def version_info(request):
         JSON response with version info including commit, timestamp, and branch.
         If version.json doesn't exist, returns default values.
     """
-    # Try to read version.json from project root
-    version_file = Path(settings.BASE_DIR) / "version.json"
-
-    default_version = {"commit": "unknown", "timestamp": "unknown", "branch": "unknown"}
-
-    if version_file.exists():
-        try:
-            with open(version_file, "r") as f:
-                version_data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            version_data = default_version
-    else:
-        version_data = default_version
-
-    return Response(version_data, status=status.HTTP_200_OK)
+    return Response(_load_version(), status=status.HTTP_200_OK)
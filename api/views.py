@@ -5,12 +5,36 @@ Provides endpoints for API discovery and navigation, allowing frontend
 applications to understand available API versions and endpoints.
 """
 
+from functools import lru_cache
+
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 
+@lru_cache(maxsize=16)
+def _build_root(scheme, host):
+    """
+    Build the discovery payload for one scheme and host.
+
+    The links only depend on the scheme and the (ALLOWED_HOSTS-validated)
+    host, so the payload is built once per pair and shared between requests.
+    """
+    base = f"{scheme}://{host}"
+    return {
+        "message": "Django Backend Boilerplate API",
+        "versions": {"v1": f"{base}/api/v1/"},
+        "authentication": {
+            "login": f"{base}/api/v1/auth/token/",
+            "status": f"{base}/api/v1/auth/status/",
+            "refresh": f"{base}/api/v1/auth/refresh-token/",
+            "revoke": f"{base}/api/v1/auth/revoke-token/",
+        },
+        "docs": {"version": f"{base}/api/v1/version/"},
+    }
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def api_root(request, format=None):
@@ -40,16 +64,6 @@ def api_root(request, format=None):
     }
     """
     return Response(
-        {
-            "message": "Django Backend Boilerplate API",
-            "versions": {"v1": request.build_absolute_uri("/api/v1/")},
-            "authentication": {
-                "login": request.build_absolute_uri("/api/v1/auth/token/"),
-                "status": request.build_absolute_uri("/api/v1/auth/status/"),
-                "refresh": request.build_absolute_uri("/api/v1/auth/refresh-token/"),
-                "revoke": request.build_absolute_uri("/api/v1/auth/revoke-token/"),
-            },
-            "docs": {"version": request.build_absolute_uri("/api/v1/version/")},
-        },
+        _build_root(request.scheme, request.get_host()),
         status=status.HTTP_200_OK,
     )
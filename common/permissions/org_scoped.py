@@ -9,7 +9,30 @@ from django.utils.translation import gettext_lazy as _
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import BasePermission
 
-from constants.roles import OrgRole
+from constants.roles import ADMIN_OR_MANAGER_ROLES, ADMIN_ROLES, ALL_ROLES
+
+
+def get_request_role(request, organization):
+    """
+    Get the requesting user's role in an organization.
+
+    All of the user's memberships are loaded in one query on first use and
+    kept on the request, so permission checks for the view and for each
+    object reuse them instead of querying per check.
+
+    Args:
+        request: The current request
+        organization: Organization instance or ID
+
+    Returns:
+        Role string or None if the user is not a member
+    """
+    role_map = vars(request).get("_role_map")
+    if role_map is None:
+        role_map = request._role_map = dict(
+            request.user.organization_memberships.values_list("organization_id", "role")
+        )
+    return role_map.get(getattr(organization, "pk", organization))
 
 
 class IsAuthenticatedAndInOrgWithRole(BasePermission):
@@ -21,13 +44,24 @@ class IsAuthenticatedAndInOrgWithRole(BasePermission):
 
     Usage:
         class MyViewSet(BaseViewSet):
-            required_roles = [OrgRole.ADMIN, OrgRole.MANAGER]
+            required_roles = MANAGER_ROLES
 
             def get_organization(self):
                 # Return the organization for this request
                 return self.get_object().organization
+
+    Subclasses can set ``required_roles`` on the permission class itself to
+    apply a fixed set of roles regardless of the view.
     """
 
+    required_roles = None
+
+    def get_required_roles(self, view):
+        """Return the roles this permission requires for the given view."""
+        if self.required_roles is not None:
+            return self.required_roles
+        return getattr(view, "required_roles", None)
+
     def has_permission(self, request, view):
         """
         Check if the user is authenticated and has the required role in the organization.
@@ -43,14 +77,14 @@ class IsAuthenticatedAndInOrgWithRole(BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
 
-        # Check if view has required_roles defined
-        required_roles = getattr(view, "required_roles", None)
+        # Check if the permission or view has required_roles defined
+        required_roles = self.get_required_roles(view)
         if required_roles is None:
             # If no roles are specified, default to allowing authenticated users
             return True
 
-        # If required_roles is an empty list, still allow authenticated users
-        if isinstance(required_roles, list) and len(required_roles) == 0:
+        # If required_roles is empty, still allow authenticated users
+        if not required_roles:
             return True
 
         # Get the organization for this request
@@ -70,11 +104,15 @@ class IsAuthenticatedAndInOrgWithRole(BasePermission):
             return False
 
         # Check if user has the required role in this organization
-        user_role = request.user.get_role(organization)
+        user_role = get_request_role(request, organization)
 
         if user_role not in required_roles:
             return False
 
+        # Remember the passed check so object checks in the same organization
+        # can skip it
+        permitted = vars(request).setdefault("_permitted_org_roles", set())
+        permitted.add((organization.pk, frozenset(required_roles)))
         return True
 
     def has_object_permission(self, request, view, obj):
@@ -83,15 +121,23 @@ class IsAuthenticatedAndInOrgWithRole(BasePermission):
 
         This ensures that the object belongs to an organization the user has access to.
         """
+        # Objects in the organization has_permission already approved for
+        # these roles need no further checks
+        required_roles = self.get_required_roles(view)
+        org_id = getattr(obj, "organization_id", None)
+        if required_roles and org_id is not None:
+            permitted = vars(request).get("_permitted_org_roles", ())
+            if (org_id, frozenset(required_roles)) in permitted:
+                return True
+
         # First check the basic permission
         if not self.has_permission(request, view):
             return False
 
         # If the object has an organization attribute, check if user has access
         if hasattr(obj, "organization"):
-            user_role = request.user.get_role(obj.organization)
-            required_roles = getattr(view, "required_roles", [])
-            return user_role in required_roles
+            user_role = get_request_role(request, obj.organization)
+            return user_role in (required_roles or ())
 
         # If no organization attribute, default to allowing access
         # (the object-level check should be handled by other means)
@@ -103,10 +149,8 @@ class IsOrgAdmin(IsAuthenticatedAndInOrgWithRole):
     Convenience permission class that requires ADMIN or SUPER_ADMIN role in the organization.
     """
 
-    def has_permission(self, request, view):
-        # Set required_roles to ADMIN and SUPER_ADMIN (SUPER_ADMIN has all ADMIN permissions)
-        view.required_roles = [OrgRole.ADMIN, OrgRole.SUPER_ADMIN]
-        return super().has_permission(request, view)
+    # SUPER_ADMIN has all ADMIN permissions
+    required_roles = ADMIN_ROLES
 
 
 class IsOrgAdminOrManager(IsAuthenticatedAndInOrgWithRole):
@@ -114,10 +158,7 @@ class IsOrgAdminOrManager(IsAuthenticatedAndInOrgWithRole):
     Convenience permission class that requires ADMIN, SUPER_ADMIN, or MANAGER role in the organization.
     """
 
-    def has_permission(self, request, view):
-        # Set required_roles to SUPER_ADMIN, ADMIN and MANAGER
-        view.required_roles = [OrgRole.SUPER_ADMIN, OrgRole.ADMIN, OrgRole.MANAGER]
-        return super().has_permission(request, view)
+    required_roles = ADMIN_OR_MANAGER_ROLES
 
 
 class IsOrgMember(IsAuthenticatedAndInOrgWithRole):
@@ -125,13 +166,4 @@ class IsOrgMember(IsAuthenticatedAndInOrgWithRole):
     Convenience permission class that allows any member of the organization.
     """
 
-    def has_permission(self, request, view):
-        # Set required_roles to all available roles
-        view.required_roles = [
-            OrgRole.ADMIN,
-            OrgRole.MANAGER,
-            OrgRole.EDITOR,
-            OrgRole.VIEWER,
-            OrgRole.SUPER_ADMIN,
-        ]
-        return super().has_permission(request, view)
+    required_roles = ALL_ROLES
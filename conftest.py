@@ -7,6 +7,13 @@ across all test modules in the project.
 
 import pytest
 
+from core.factories import (
+    OrganizationFactory,
+    OrganizationMembershipFactory,
+    ProjectFactory,
+    UserFactory,
+)
+
 
 @pytest.fixture
 def user_factory():
@@ -16,8 +23,6 @@ def user_factory():
     Returns:
         UserFactory: Factory class for creating User instances
     """
-    from core.factories import UserFactory
-
     return UserFactory
 
 
@@ -29,8 +34,6 @@ def org_factory():
     Returns:
         OrganizationFactory: Factory class for creating Organization instances
     """
-    from core.factories import OrganizationFactory
-
     return OrganizationFactory
 
 
@@ -42,8 +45,6 @@ def member_factory():
     Returns:
         OrganizationMembershipFactory: Factory class for creating OrganizationMembership instances
     """
-    from core.factories import OrganizationMembershipFactory
-
     return OrganizationMembershipFactory
 
 
@@ -55,8 +56,6 @@ def project_factory():
     Returns:
         ProjectFactory: Factory class for creating Project instances
     """
-    from core.factories import ProjectFactory
-
     return ProjectFactory
 
 
@@ -104,6 +103,31 @@ def sample_project(project_factory):
     return project_factory.create()
 
 
+@pytest.fixture
+def built_user(user_factory):
+    """
+    Fixture that builds an unsaved sample user.
+
+    Use it instead of sample_user when the test never hits the database,
+    e.g. serializer or permission introspection.
+
+    Returns:
+        User: An unsaved User instance with default test data
+    """
+    return user_factory.build()
+
+
+@pytest.fixture
+def built_organization(org_factory):
+    """
+    Fixture that builds an unsaved sample organization.
+
+    Returns:
+        Organization: An unsaved Organization instance with default test data
+    """
+    return org_factory.build()
+
+
 @pytest.fixture
 def user_with_organization(user_factory, org_factory, member_factory):
     """
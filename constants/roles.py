@@ -10,3 +10,16 @@ class OrgRole(models.TextChoices):
     EDITOR = "editor", _("Editor")
     VIEWER = "viewer", _("Viewer")
     SUPER_ADMIN = "super_admin", _("Super Admin")
+
+
+# Role sets for permission checks, shared so every endpoint grants the same
+# roles. SUPER_ADMIN is only part of the sets that name it explicitly.
+MANAGER_ROLES = frozenset({OrgRole.ADMIN, OrgRole.MANAGER})
+EDITOR_ROLES = MANAGER_ROLES | {OrgRole.EDITOR}
+MEMBER_ROLES = EDITOR_ROLES | {OrgRole.VIEWER}
+ADMIN_ROLES = frozenset({OrgRole.ADMIN, OrgRole.SUPER_ADMIN})
+ADMIN_OR_MANAGER_ROLES = ADMIN_ROLES | {OrgRole.MANAGER}
+ALL_ROLES = frozenset(OrgRole)
+
+# Storage reads are open to viewers but not editors
+STORAGE_READ_ROLES = MANAGER_ROLES | {OrgRole.VIEWER}
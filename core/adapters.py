@@ -7,13 +7,23 @@ and account management with organization scoping.
 
 import logging
 
-from allauth.account.adapter import DefaultAccountAdapter
+from allauth.account.adapter import DefaultAccountAdapter, get_adapter
 from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
 from django.contrib import messages
 from django.utils.translation import gettext_lazy as _
 
 logger = logging.getLogger(__name__)
 
+# Supported user languages keyed by the locale's language subtag
+_LOCALE_LANGUAGES = {"en": "en", "fr": "fr"}
+_DEFAULT_LANGUAGE = "en"
+
+
+def _language_for_locale(locale):
+    """Map a provider locale such as "fr_FR" or "fr-CA" to a user language."""
+    subtag = locale.lower().replace("_", "-").split("-", 1)[0]
+    return _LOCALE_LANGUAGES.get(subtag, _DEFAULT_LANGUAGE)
+
 
 class CustomAccountAdapter(DefaultAccountAdapter):
     """
@@ -57,7 +67,7 @@ class CustomAccountAdapter(DefaultAccountAdapter):
         if commit:
             user.save()
 
-        logger.info(f"User created via email signup: {user.email}")
+        logger.info("User created via email signup: %s", user.email)
         return user
 
 
@@ -102,25 +112,29 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
 
         if not email:
             logger.warning(
-                f"No email found in social login data for provider {sociallogin.account.provider}"
+                "No email found in social login data for provider %s",
+                sociallogin.account.provider,
             )
             return
 
         # Log the social login attempt
-        logger.info(f"Social login attempt: {email} via {sociallogin.account.provider}")
+        logger.info(
+            "Social login attempt: %s via %s", email, sociallogin.account.provider
+        )
 
         # Check if user exists with this email
         from core.models import User
 
-        try:
-            existing_user = User.objects.get(email=email)
-            if not sociallogin.is_existing:
-                # Connect the social account to existing user
-                sociallogin.connect(request, existing_user)
-                logger.info(f"Connected social account to existing user: {email}")
-        except User.DoesNotExist:
-            # New user - will be handled by save_user
-            pass
+        # Returning logins are already connected, so skip the lookup for them.
+        # New users (no match) will be handled by save_user.
+        if sociallogin.is_existing:
+            return
+
+        existing_user = User.objects.filter(email=email).first()
+        if existing_user:
+            # Connect the social account to existing user
+            sociallogin.connect(request, existing_user)
+            logger.info("Connected social account to existing user: %s", email)
 
     def save_user(self, request, sociallogin, form=None):
         """
@@ -134,36 +148,54 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         Returns:
             User: The saved user instance
         """
-        user = super().save_user(request, sociallogin, form)
-
-        # Extract additional user information from social account
-        extra_data = sociallogin.account.extra_data
+        user = sociallogin.user
         provider = sociallogin.account.provider
 
-        # Set full_name from social account if not set
-        if not user.full_name and extra_data:
-            name = extra_data.get("name") or extra_data.get("displayName")
-            if name:
-                user.full_name = name
-
-        # Set language based on locale from social account
-        if extra_data and extra_data.get("locale"):
-            locale = extra_data.get("locale", "").lower()
-            if locale.startswith("fr"):
-                user.language = "fr"
-            else:
-                user.language = "en"
-
-        user.save()
+        if form:
+            # The account adapter would save the user straight away and set
+            # the request language, so fill in the form fields without
+            # committing. The provider locale then still wins, and
+            # sociallogin.save() writes the user row once.
+            user.set_unusable_password()
+            get_adapter(request).save_user(request, user, form, commit=False)
+            self._populate_profile(user, sociallogin)
+            sociallogin.save(request)
+        else:
+            # Fill in profile fields before the parent saves the user, so
+            # signup writes the user row only once
+            self._populate_profile(user, sociallogin)
+            user = super().save_user(request, sociallogin, form)
 
         # TODO: Organization scoping logic
         # This is where you would implement organization assignment
         # based on email domain, invitations, or other business rules
         self._handle_organization_assignment(user, sociallogin)
 
-        logger.info(f"User created via {provider} SSO: {user.email}")
+        logger.info("User created via %s SSO: %s", provider, user.email)
         return user
 
+    def _populate_profile(self, user, sociallogin):
+        """
+        Copy the name and language from the social account onto the user.
+
+        Args:
+            user: The user instance
+            sociallogin: Social login instance
+        """
+        extra_data = sociallogin.account.extra_data
+        if not extra_data:
+            return
+
+        # Set full_name from social account if not set
+        if not user.full_name:
+            name = extra_data.get("name") or extra_data.get("displayName")
+            if name:
+                user.full_name = name
+
+        # Set language based on locale from social account
+        if extra_data.get("locale"):
+            user.language = _language_for_locale(extra_data["locale"])
+
     def _handle_organization_assignment(self, user, sociallogin):
         """
         Handle organization assignment for new social users.
@@ -180,7 +212,9 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         # 4. Require manual organization assignment
 
         # For now, we'll just log that no organization was assigned
-        logger.info(f"No organization assignment implemented for user: {user.email}")
+        logger.info(
+            "No organization assignment implemented for user: %s", user.email
+        )
         # You could create a default organization or require assignment later
 
     def get_connect_redirect_url(self, request, socialaccount):
@@ -210,7 +244,7 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
             exception: Exception instance
             extra_context: Additional context
         """
-        logger.error(f"Social authentication error for {provider_id}: {error}")
+        logger.error("Social authentication error for %s: %s", provider_id, error)
 
         # Add user-friendly error message
         if error == "access_denied":
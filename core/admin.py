@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models.functions import Substr
 from django.utils.translation import gettext_lazy as _
 
 from .models import (
@@ -14,6 +15,7 @@ from .models import (
     EvidenceInsight,
     Recommendation,
 )
+from .utils import count_per_row
 
 
 @admin.register(User)
@@ -104,6 +106,11 @@ class OrganizationMembershipInline(admin.TabularInline):
     extra = 0
     fields = ("user", "role", "is_default", "created_at")
     readonly_fields = ("created_at",)
+    raw_id_fields = ("user",)
+
+    def get_queryset(self, request):
+        """Load each membership's user and organization with the rows."""
+        return super().get_queryset(request).select_related("user", "organization")
 
 
 @admin.register(Organization)
@@ -133,11 +140,18 @@ class OrganizationAdmin(admin.ModelAdmin):
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
     inlines = [OrganizationMembershipInline]
 
+    def get_queryset(self, request):
+        """Annotate member counts for the changelist."""
+        return super().get_queryset(request).annotate(
+            _member_count=count_per_row(OrganizationMembership.objects, "organization")
+        )
+
     def member_count(self, obj):
         """Display the number of members in the organization."""
-        return obj.user_memberships.count()
+        return obj._member_count
 
     member_count.short_description = _("Members")
+    member_count.admin_order_field = "_member_count"
 
     def get_readonly_fields(self, request, obj=None):
         """Make ID field readonly for existing objects."""
@@ -152,6 +166,8 @@ class OrganizationMembershipAdmin(admin.ModelAdmin):
     """Admin configuration for the OrganizationMembership model."""
 
     list_display = ("user", "organization", "role", "is_default", "created_at")
+    list_select_related = ("user", "organization")
+    raw_id_fields = ("user", "organization")
     list_filter = ("role", "is_default", "created_at", "organization")
     search_fields = ("user__email", "user__full_name", "organization__name")
     ordering = ("organization", "user")
@@ -186,6 +202,7 @@ class TagAdmin(admin.ModelAdmin):
         "created_at",
         "created_by",
     )
+    list_select_related = ("organization", "created_by")
     list_filter = ("organization", "created_at")
     search_fields = ("title", "definition", "organization__name")
     ordering = ("organization", "title")
@@ -210,25 +227,42 @@ class TagAdmin(admin.ModelAdmin):
 
     def definition_short(self, obj):
         """Display a shortened version of the definition."""
-        if obj.definition:
-            return obj.definition[:50] + "..." if len(obj.definition) > 50 else obj.definition
+        definition = getattr(obj, "_definition_short", obj.definition)
+        if definition:
+            return definition[:50] + "..." if len(definition) > 50 else definition
         return _("No definition")
 
     definition_short.short_description = _("Definition")
 
+    def get_queryset(self, request):
+        """Annotate usage counts and the definition preview for the changelist."""
+        queryset = super().get_queryset(request)
+        opts = self.model._meta
+        changelist = f"{opts.app_label}_{opts.model_name}_changelist"
+        match = request.resolver_match
+        if match is None or match.url_name != changelist:
+            return queryset
+        # Only the first 51 characters are needed to tell whether the preview
+        # was cut, so the full definition is left in the database until a
+        # change form asks for it.
+        return queryset.defer("definition").annotate(
+            _definition_short=Substr("definition", 1, 51),
+            # Count usage across all taggable models
+            _usage_count=(
+                count_per_row(Project.objects, "tags") +
+                count_per_row(EvidenceSource.objects, "tags") +
+                count_per_row(EvidenceFact.objects, "tags") +
+                count_per_row(EvidenceInsight.objects, "tags") +
+                count_per_row(Recommendation.objects, "tags")
+            ),
+        )
+
     def usage_count_display(self, obj):
         """Display how many times this tag is used across all models."""
-        # Count usage across all taggable models
-        usage_count = (
-            obj.projects.count() +
-            obj.evidence_sources.count() +
-            obj.evidence_facts.count() +
-            obj.evidence_insights.count() +
-            obj.recommendations.count()
-        )
-        return usage_count
+        return obj._usage_count
 
     usage_count_display.short_description = _("Usage Count")
+    usage_count_display.admin_order_field = "_usage_count"
 
     def get_readonly_fields(self, request, obj=None):
         """Make ID field readonly for existing objects."""
@@ -251,6 +285,8 @@ class ProjectAdmin(admin.ModelAdmin):
         "created_at",
         "created_by",
     ]
+    list_select_related = ["organization", "created_by"]
+    raw_id_fields = ["organization"]
     list_filter = [
         "status",
         "organization",
@@ -295,6 +331,8 @@ class EvidenceSourceAdmin(admin.ModelAdmin):
         "created_at",
         "created_by",
     ]
+    list_select_related = ["organization", "created_by"]
+    raw_id_fields = ["organization"]
     list_filter = [
         "type",
         "processing_status",
@@ -345,6 +383,8 @@ class EvidenceFactAdmin(admin.ModelAdmin):
         "created_at",
         "created_by",
     ]
+    list_select_related = ["organization", "source", "created_by"]
+    raw_id_fields = ["organization", "source"]
     list_filter = [
         "sentiment",
         "organization",
@@ -394,6 +434,8 @@ class EvidenceChunkAdmin(admin.ModelAdmin):
         "created_at",
         "created_by",
     ]
+    list_select_related = ["source", "organization", "created_by"]
+    raw_id_fields = ["organization", "source"]
     list_filter = [
         "organization",
         "created_at",
@@ -439,6 +481,8 @@ class EvidenceInsightAdmin(admin.ModelAdmin):
         "created_at",
         "created_by",
     ]
+    list_select_related = ["organization", "created_by"]
+    raw_id_fields = ["organization"]
     list_filter = [
         "priority",
         "sentiment",
@@ -492,6 +536,8 @@ class RecommendationAdmin(admin.ModelAdmin):
         "created_at",
         "created_by",
     ]
+    list_select_related = ["organization", "created_by"]
+    raw_id_fields = ["organization"]
     list_filter = [
         "type",
         "status",
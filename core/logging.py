@@ -5,6 +5,7 @@ This module provides structured JSON-based logging with contextual information
 including request ID, user ID, and organization ID for better observability.
 """
 
+import logging
 import threading
 import uuid
 from typing import Dict, Optional
@@ -203,7 +204,9 @@ def configure_structlog():
                 else structlog.dev.ConsoleRenderer()
             ),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(20),  # DEBUG level
+        # The filtering wrapper binds below-threshold methods (e.g. debug) to
+        # no-ops, so disabled calls return before any processor runs.
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
         logger_factory=structlog.WriteLoggerFactory(),
         cache_logger_on_first_use=True,
     )
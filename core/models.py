@@ -361,7 +361,9 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
             Organization instance or None if no default is set
         """
         try:
-            membership = self.organization_memberships.get(is_default=True)
+            membership = self.organization_memberships.select_related(
+                "organization"
+            ).get(is_default=True)
             return membership.organization
         except OrganizationMembership.DoesNotExist:
             return None
@@ -585,6 +587,98 @@ class TaggableMixin(models.Model):
         except Tag.DoesNotExist:
             return False
 
+    def add_tags(self, titles, organization=None, created_by=None):
+        """
+        Add several tags to this object using a fixed number of queries.
+
+        Missing tags are inserted in one batch and existing ones are reused;
+        soft deleted tags with a requested title are restored.
+
+        Args:
+            titles (list[str]): Titles of the tags to add
+            organization: Organization for the tags (uses self.organization if available)
+            created_by: User who created the tags
+
+        Returns:
+            list[Tag]: The created or existing tags
+
+        Raises:
+            ValueError: If organization cannot be determined
+            ValidationError: If any title is empty or only whitespace
+        """
+        # Try to get organization from the object itself if not provided
+        if organization is None:
+            if hasattr(self, "organization"):
+                organization = self.organization
+            else:
+                raise ValueError(
+                    _(
+                        "Organization must be provided or object must have an organization attribute"
+                    )
+                )
+
+        titles = list(dict.fromkeys(title.strip() for title in titles))
+        if not all(titles):
+            raise ValidationError(
+                {"title": _("Tag title cannot be empty or only whitespace.")}
+            )
+
+        from core.models import Tag
+
+        # bulk_create bypasses Tag.save() and the pre_save audit signal, so
+        # titles are stripped above and audit fields are set explicitly here
+        Tag.objects.bulk_create(
+            [
+                Tag(
+                    title=title,
+                    organization=organization,
+                    created_by=created_by,
+                    updated_by=created_by,
+                )
+                for title in titles
+            ],
+            ignore_conflicts=True,
+        )
+        # Soft deleted tags still hold their title, so bulk_create skipped them
+        tags = list(
+            Tag.all_objects.filter(organization=organization, title__in=titles)
+        )
+        deleted = [tag for tag in tags if tag.is_deleted]
+        if deleted:
+            Tag.all_objects.filter(pk__in=[tag.pk for tag in deleted]).update(
+                deleted_at=None, updated_by=created_by
+            )
+            for tag in deleted:
+                tag.deleted_at = None
+                tag.updated_by = created_by
+
+        if hasattr(self, 'tags'):
+            self.tags.add(*tags)
+
+        return tags
+
+    @classmethod
+    def remove_tags_by_id(cls, pk, titles, organization_id):
+        """
+        Remove tags from the object with the given primary key without loading it.
+
+        Deletes the matching rows of the tags through table directly.
+
+        Args:
+            pk: Primary key of the tagged object
+            titles (list[str]): Titles of the tags to remove
+            organization_id: ID of the organization the tags belong to
+
+        Returns:
+            int: Number of tags that were detached from the object
+        """
+        through = cls._meta.get_field("tags").remote_field.through
+        return through.objects.filter(
+            **{f"{cls._meta.model_name}_id": pk},
+            tag__organization_id=organization_id,
+            tag__title__in=[title.strip() for title in titles],
+        ).delete()[0]
+
     def get_tag_names(self):
         """
         Get all tag titles for this object.
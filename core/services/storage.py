@@ -8,20 +8,31 @@ for common file operations.
 
 import logging
 import uuid
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, FrozenSet, Union
 from pathlib import Path
 
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.conf import settings
 
 from core.models import User, Organization
 from core.storage import OrganizationScopedGCSStorage
-from constants.roles import OrgRole
+from constants.roles import MANAGER_ROLES, STORAGE_READ_ROLES, OrgRole
 
 logger = logging.getLogger(__name__)
 
 
+def signed_url_cache_timeout(expire_seconds: int) -> int:
+    """
+    How long a signed download URL may be reused from the cache.
+    
+    A quarter of the URL's lifetime (at least a minute, never longer than
+    the URL itself), so a cached URL always has most of its validity left.
+    """
+    return min(expire_seconds, max(60, expire_seconds // 4))
+
+
 class StorageService:
     """
     High-level storage service with RBAC enforcement.
@@ -44,28 +55,29 @@ class StorageService:
         if not self.organization:
             raise ValueError("Organization context is required for storage operations")
             
-        # Verify user has access to the organization
-        if not user.get_role(self.organization):
+        # Verify user has access to the organization. The role is kept for
+        # permission checks; a service lives for a single request.
+        self.role = user.get_role(self.organization)
+        if not self.role:
             raise PermissionDenied(f"User does not have access to organization {self.organization.name}")
             
         self.storage = OrganizationScopedGCSStorage(organization_id=str(self.organization.id))
 
-    def _check_permission(self, required_roles: List[OrgRole], operation: str = "operation"):
+    def _check_permission(self, required_roles: FrozenSet[OrgRole], operation: str = "operation"):
         """
         Check if user has required permissions for the operation.
         
         Args:
-            required_roles: List of roles that can perform the operation
+            required_roles: Roles that can perform the operation
             operation: Description of the operation for error messages
             
         Raises:
             PermissionDenied: If user doesn't have required permissions
         """
-        user_role = self.user.get_role(self.organization)
-        if user_role not in [role.value for role in required_roles]:
+        if self.role not in required_roles:
             raise PermissionDenied(
-                f"User role '{user_role}' insufficient for {operation}. "
-                f"Required roles: {[role.value for role in required_roles]}"
+                f"User role '{self.role}' insufficient for {operation}. "
+                f"Required roles: {sorted(role.value for role in required_roles)}"
             )
 
     def _validate_file_path(self, file_path: str) -> str:
@@ -95,6 +107,10 @@ class StorageService:
             
         return str(path)
 
+    def _download_url_cache_key(self, file_path: str) -> str:
+        """Cache key for a file's signed download URL within the organization."""
+        return f"storage:download-url:{self.organization.id}:{file_path}"
+
     def upload_file(
         self, 
         file: UploadedFile, 
@@ -119,7 +135,7 @@ class StorageService:
             ValidationError: If file is invalid
         """
         # Check permissions - admins and managers can upload
-        self._check_permission([OrgRole.ADMIN, OrgRole.MANAGER], "file upload")
+        self._check_permission(MANAGER_ROLES, "file upload")
         
         # Validate file
         if not file or not file.name:
@@ -195,15 +211,21 @@ class StorageService:
             PermissionDenied: If user lacks access permissions
         """
         # Check permissions - all organization members can view files
-        self._check_permission([OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.VIEWER], "file access")
+        self._check_permission(STORAGE_READ_ROLES, "file access")
         
         file_path = self._validate_file_path(file_path)
         
+        # Reuse a recently signed URL for the same file and lifetime; this skips
+        # the existence check and signing, and gives clients a stable URL to cache
+        url = self._get_cached_download_url(file_path, expire_seconds)
+        if url:
+            return url
+        
         if not self.storage.exists(file_path):
             raise ValidationError(f"File not found: {file_path}")
             
         try:
-            url = self.storage.url(file_path, expire=expire_seconds)
+            url = self._sign_download_url(file_path, expire_seconds)
             
             logger.info(
                 f"Generated file URL",
@@ -229,6 +251,69 @@ class StorageService:
             )
             raise
 
+    def _get_cached_download_url(self, file_path: str, expire_seconds: int) -> Optional[str]:
+        """Return a cached signed URL for the file with the same lifetime, if any."""
+        cached = cache.get(self._download_url_cache_key(file_path))
+        if cached and cached[0] == expire_seconds:
+            return cached[1]
+        return None
+
+    def _sign_download_url(self, file_path: str, expire_seconds: int) -> str:
+        """Sign a download URL for an existing file and cache it for reuse."""
+        url = self.storage.url(file_path, expire=expire_seconds)
+        cache.set(
+            self._download_url_cache_key(file_path),
+            (expire_seconds, url),
+            timeout=signed_url_cache_timeout(expire_seconds)
+        )
+        return url
+
+    def get_upload_url(
+        self,
+        file_path: str,
+        content_type: str = None,
+        expire_seconds: int = 3600
+    ) -> str:
+        """
+        Get a signed URL the client can upload a file to directly.
+        
+        The file bytes go straight to the bucket instead of through Django.
+        
+        Args:
+            file_path: Path the file will be stored at
+            content_type: Content type the client must upload with (optional)
+            expire_seconds: URL expiration time in seconds
+            
+        Returns:
+            Signed upload URL for the file
+            
+        Raises:
+            PermissionDenied: If user lacks upload permissions
+            ValidationError: If the path is invalid
+        """
+        # Check permissions - same roles as a direct upload
+        self._check_permission(MANAGER_ROLES, "file upload")
+        
+        file_path = self._validate_file_path(file_path)
+        
+        url = self.storage.upload_url(
+            file_path,
+            content_type=content_type,
+            expire=expire_seconds
+        )
+        
+        logger.info(
+            f"Generated file upload URL",
+            extra={
+                'user_id': str(self.user.id),
+                'organization_id': str(self.organization.id),
+                'file_path': file_path,
+                'expire_seconds': expire_seconds
+            }
+        )
+        
+        return url
+
     def delete_file(self, file_path: str) -> bool:
         """
         Delete a file.
@@ -243,7 +328,7 @@ class StorageService:
             PermissionDenied: If user lacks delete permissions
         """
         # Check permissions - only admins and managers can delete
-        self._check_permission([OrgRole.ADMIN, OrgRole.MANAGER], "file deletion")
+        self._check_permission(MANAGER_ROLES, "file deletion")
         
         file_path = self._validate_file_path(file_path)
         
@@ -252,6 +337,7 @@ class StorageService:
             
         try:
             self.storage.delete(file_path)
+            cache.delete(self._download_url_cache_key(file_path))
             
             logger.info(
                 f"File deleted successfully",
@@ -276,13 +362,67 @@ class StorageService:
             )
             raise
 
-    def list_files(self, directory: str = "", category: str = None) -> List[Dict[str, Any]]:
+    def delete_files(self, file_paths: List[str]) -> int:
+        """
+        Delete several files in batched storage requests.
+        
+        Unlike delete_file, missing files are not reported; the call is
+        idempotent so retried bulk deletions succeed.
+        
+        Args:
+            file_paths: Paths of the files to delete
+            
+        Returns:
+            Number of paths submitted for deletion
+            
+        Raises:
+            PermissionDenied: If user lacks delete permissions
+            ValidationError: If any path is invalid
+        """
+        self._check_permission(MANAGER_ROLES, "file deletion")
+        
+        file_paths = list(dict.fromkeys(self._validate_file_path(path) for path in file_paths))
+        
+        try:
+            self.storage.delete_many(file_paths)
+            cache.delete_many([self._download_url_cache_key(path) for path in file_paths])
+            
+            logger.info(
+                f"Files deleted successfully",
+                extra={
+                    'user_id': str(self.user.id),
+                    'organization_id': str(self.organization.id),
+                    'file_count': len(file_paths)
+                }
+            )
+            
+            return len(file_paths)
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to delete files",
+                extra={
+                    'user_id': str(self.user.id),
+                    'organization_id': str(self.organization.id),
+                    'file_count': len(file_paths),
+                    'error': str(e)
+                }
+            )
+            raise
+
+    def list_files(
+        self,
+        directory: str = "",
+        category: str = None,
+        include_urls: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         List files in a directory.
         
         Args:
             directory: Directory path to list (defaults to root)
             category: Filter by file category
+            include_urls: Whether to sign a download URL for each file
             
         Returns:
             List of file information dictionaries
@@ -290,33 +430,13 @@ class StorageService:
         Raises:
             PermissionDenied: If user lacks list permissions
         """
-        # Check permissions - all organization members can list files
-        self._check_permission([OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.VIEWER], "file listing")
-        
-        if directory:
-            directory = self._validate_file_path(directory)
-            
-        # Add category filter if specified
-        if category:
-            directory = f"{category}/" + directory if directory else category
+        directory = self._prepare_listing(directory, category)
             
         try:
-            dirs, files = self.storage.listdir(directory)
-            
-            file_list = []
-            for file_name in files:
-                full_path = f"{directory}/{file_name}".strip('/')
-                try:
-                    file_info = {
-                        'name': file_name,
-                        'path': full_path,
-                        'size': self.storage.size(full_path),
-                        'modified_time': self.storage.get_modified_time(full_path),
-                        'url': self.storage.url(full_path)
-                    }
-                    file_list.append(file_info)
-                except Exception as e:
-                    logger.warning(f"Could not get info for file {full_path}: {e}")
+            # Size and modified time come back with the listing itself
+            dirs, files = self.storage.listdir_with_metadata(directory)
+            
+            file_list = self._build_file_list(directory, files, include_urls)
                     
             logger.info(
                 f"Listed files in directory",
@@ -342,6 +462,116 @@ class StorageService:
             )
             raise
 
+    def list_files_page(
+        self,
+        directory: str = "",
+        category: str = None,
+        page_size: int = 1000,
+        page_token: str = None,
+        include_urls: bool = True
+    ) -> Dict[str, Any]:
+        """
+        List one page of files in a directory.
+        
+        Args:
+            directory: Directory path to list (defaults to root)
+            category: Filter by file category
+            page_size: Maximum number of files to return
+            page_token: Token from the previous page's 'next_page_token'
+            include_urls: Whether to sign a download URL for each file
+            
+        Returns:
+            Dictionary with 'files' (as returned by list_files) and
+            'next_page_token', which is None on the last page
+            
+        Raises:
+            PermissionDenied: If user lacks list permissions
+        """
+        directory = self._prepare_listing(directory, category)
+        
+        try:
+            dirs, files, next_page_token = self.storage.listdir_page(
+                directory, page_size, page_token
+            )
+            
+            file_list = self._build_file_list(directory, files, include_urls)
+            
+            logger.info(
+                f"Listed files page in directory",
+                extra={
+                    'user_id': str(self.user.id),
+                    'organization_id': str(self.organization.id),
+                    'directory': directory,
+                    'file_count': len(file_list)
+                }
+            )
+            
+            return {
+                'files': file_list,
+                'next_page_token': next_page_token,
+            }
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to list files page",
+                extra={
+                    'user_id': str(self.user.id),
+                    'organization_id': str(self.organization.id),
+                    'directory': directory,
+                    'error': str(e)
+                }
+            )
+            raise
+
+    def _prepare_listing(self, directory: str, category: str = None) -> str:
+        """
+        Check list permissions and resolve the directory to list.
+        
+        Raises:
+            PermissionDenied: If user lacks list permissions
+        """
+        # Check permissions - all organization members can list files
+        self._check_permission(STORAGE_READ_ROLES, "file listing")
+        
+        if directory:
+            directory = self._validate_file_path(directory)
+            
+        # Add category filter if specified
+        if category:
+            directory = f"{category}/" + directory if directory else category
+            
+        return directory
+
+    def _build_file_list(
+        self,
+        directory: str,
+        files: List[Dict[str, Any]],
+        include_urls: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Turn listing metadata into file info dictionaries.
+        
+        Signed URLs are generated for the whole listing in one batch. Files
+        whose URL cannot be generated are left out; with include_urls=False
+        no URLs are signed and 'url' is None.
+        """
+        paths = [f"{directory}/{file_meta['name']}".strip('/') for file_meta in files]
+        urls = self.storage.urls(paths) if include_urls else None
+        
+        file_list = []
+        for file_meta, full_path in zip(files, paths):
+            if urls is not None and full_path not in urls:
+                continue
+            file_list.append({
+                'name': file_meta['name'],
+                'path': full_path,
+                'size': file_meta['size'],
+                'modified_time': file_meta['modified_time'],
+                'url': urls[full_path] if urls is not None else None
+            })
+                
+        return file_list
+
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
         Get detailed information about a file.
@@ -356,7 +586,7 @@ class StorageService:
             PermissionDenied: If user lacks access permissions
         """
         # Check permissions - all organization members can get file info
-        self._check_permission([OrgRole.ADMIN, OrgRole.MANAGER, OrgRole.VIEWER], "file info access")
+        self._check_permission(STORAGE_READ_ROLES, "file info access")
         
         file_path = self._validate_file_path(file_path)
         
@@ -370,7 +600,10 @@ class StorageService:
                 'created_time': self.storage.get_created_time(file_path),
                 'modified_time': self.storage.get_modified_time(file_path),
                 'exists': True,
-                'url': self.storage.url(file_path)
+                'url': (
+                    self._get_cached_download_url(file_path, 3600)
+                    or self._sign_download_url(file_path, 3600)
+                )
             }
             
             return file_info
@@ -398,34 +631,14 @@ class StorageService:
             PermissionDenied: If user lacks access permissions
         """
         # Check permissions - only admins and managers can view usage stats
-        self._check_permission([OrgRole.ADMIN, OrgRole.MANAGER], "storage usage access")
+        self._check_permission(MANAGER_ROLES, "storage usage access")
         
         try:
-            # This is a simplified implementation
-            # In a production system, you might want to cache this information
-            # or maintain usage statistics in the database
-            
-            dirs, files = self.storage.listdir("")
-            total_size = 0
-            file_count = 0
-            
-            def calculate_directory_size(directory):
-                nonlocal total_size, file_count
-                dirs, files = self.storage.listdir(directory)
-                
-                for file_name in files:
-                    file_path = f"{directory}/{file_name}".strip('/')
-                    try:
-                        total_size += self.storage.size(file_path)
-                        file_count += 1
-                    except Exception:
-                        pass  # Skip files that can't be accessed
-                        
-                for subdir in dirs:
-                    subdir_path = f"{directory}/{subdir}".strip('/')
-                    calculate_directory_size(subdir_path)
-            
-            calculate_directory_size("")
+            # One flat listing of the organization's prefix; in a production
+            # system you might cache this or keep usage statistics in the database
+            usage = self.storage.usage("")
+            total_size = usage['total_size']
+            file_count = usage['file_count']
             
             usage_info = {
                 'total_size_bytes': total_size,
@@ -7,7 +7,8 @@ while enforcing Role-Based Access Control (RBAC) at the organization level.
 
 import os
 import logging
-from typing import Optional, Union, Dict, Any
+from datetime import timedelta
+from typing import Optional, Union, Dict, Any, List
 from urllib.parse import urljoin
 
 from django.conf import settings
@@ -17,6 +18,18 @@ from django.utils.deconstruct import deconstructible
 
 logger = logging.getLogger(__name__)
 
+# GCS clients are expensive to build (credential discovery, HTTP session setup),
+# and a new storage instance is created for every request, so clients are kept
+# per configuration for the lifetime of the process.
+_clients = {}
+_ensured_emulator_buckets = set()
+
+
+def _reset_client_cache():
+    """Drop cached GCS clients and emulator bucket checks (used by tests)."""
+    _clients.clear()
+    _ensured_emulator_buckets.clear()
+
 
 @deconstructible
 class GCSStorage(Storage):
@@ -27,6 +40,13 @@ class GCSStorage(Storage):
     access control based on the current user's organization membership.
     """
 
+    # Resumable uploads read one chunk into memory per request; the client's
+    # default is 100 MiB. Must be a multiple of 256 KiB.
+    upload_chunk_size = 8 * 1024 * 1024
+
+    # GCS accepts at most 100 calls per batch request.
+    delete_batch_size = 100
+
     def __init__(self, bucket_name=None, client_options=None):
         """
         Initialize GCS storage backend.
@@ -43,39 +63,47 @@ class GCSStorage(Storage):
 
     @property
     def client(self):
-        """Lazy initialization of GCS client."""
+        """Lazy initialization of GCS client, shared per configuration."""
         if self._client is None:
-            try:
-                # Import here to avoid ImportError if google-cloud-storage is not installed
-                from google.cloud import storage
-                
-                if self.use_emulator:
-                    # For emulator, ensure the STORAGE_EMULATOR_HOST environment variable is set
-                    api_endpoint = self.client_options.get('api_endpoint')
-                    if api_endpoint:
-                        # Remove http:// prefix for the STORAGE_EMULATOR_HOST env var
-                        emulator_host = api_endpoint.replace('http://', '').replace('https://', '')
-                        os.environ['STORAGE_EMULATOR_HOST'] = emulator_host
-                        logger.info(f"Set STORAGE_EMULATOR_HOST to: {emulator_host}")
-                    
-                    # Create client without authentication for emulator
-                    self._client = storage.Client.create_anonymous_client()
-                else:
-                    # For production, use default authentication
-                    self._client = storage.Client(**self.client_options)
-                    
-            except ImportError:
-                logger.error("google-cloud-storage is required but not installed")
-                raise ImportError(
-                    "google-cloud-storage is required for GCS storage backend. "
-                    "Install it with: pip install google-cloud-storage"
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize GCS client: {e}")
-                raise
+            key = (self.use_emulator, repr(sorted(self.client_options.items())))
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = self._create_client()
+            self._client = client
 
         return self._client
 
+    def _create_client(self):
+        """Create a new GCS client for this storage's configuration."""
+        try:
+            # Import here to avoid ImportError if google-cloud-storage is not installed
+            from google.cloud import storage
+            
+            if self.use_emulator:
+                # For emulator, ensure the STORAGE_EMULATOR_HOST environment variable is set
+                api_endpoint = self.client_options.get('api_endpoint')
+                if api_endpoint:
+                    # Remove http:// prefix for the STORAGE_EMULATOR_HOST env var
+                    emulator_host = api_endpoint.replace('http://', '').replace('https://', '')
+                    os.environ['STORAGE_EMULATOR_HOST'] = emulator_host
+                    logger.info(f"Set STORAGE_EMULATOR_HOST to: {emulator_host}")
+                
+                # Create client without authentication for emulator
+                return storage.Client.create_anonymous_client()
+            else:
+                # For production, use default authentication
+                return storage.Client(**self.client_options)
+                
+        except ImportError:
+            logger.error("google-cloud-storage is required but not installed")
+            raise ImportError(
+                "google-cloud-storage is required for GCS storage backend. "
+                "Install it with: pip install google-cloud-storage"
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize GCS client: {e}")
+            raise
+
     @property
     def bucket(self):
         """Lazy initialization of GCS bucket."""
@@ -83,12 +111,14 @@ class GCSStorage(Storage):
             try:
                 self._bucket = self.client.bucket(self.bucket_name)
                 
-                # Create bucket if using emulator and it doesn't exist
-                if self.use_emulator:
+                # Create bucket if using emulator and it doesn't exist. This
+                # only needs checking once per process, not per storage instance.
+                if self.use_emulator and self.bucket_name not in _ensured_emulator_buckets:
                     try:
                         if not self._bucket.exists():
                             self._bucket.create()
                             logger.info(f"Created emulator bucket: {self.bucket_name}")
+                        _ensured_emulator_buckets.add(self.bucket_name)
                     except Exception as e:
                         logger.warning(f"Could not create emulator bucket: {e}")
                         
@@ -176,14 +206,17 @@ class GCSStorage(Storage):
             Final file path
         """
         try:
-            blob = self.bucket.blob(name)
+            blob = self.bucket.blob(name, chunk_size=self.upload_chunk_size)
             
             # Set content type if available
             if hasattr(content, 'content_type'):
                 blob.content_type = content.content_type
             
-            # Upload the file
-            blob.upload_from_file(content, rewind=True)
+            # Upload the file straight from the uploaded file handle. Passing the
+            # known size lets the client send small files in a single request and
+            # stream larger ones in chunks instead of always starting a resumable
+            # upload session.
+            blob.upload_from_file(content, rewind=True, size=getattr(content, 'size', None))
             
             logger.info(f"Successfully saved file: {name}")
             return name
@@ -207,6 +240,36 @@ class GCSStorage(Storage):
             logger.error(f"Failed to delete file {name}: {e}")
             raise
 
+    def delete_many(self, names: List[str]) -> None:
+        """
+        Delete several files from GCS using batched requests.
+        
+        Deletions are sent as multipart batch requests of up to
+        ``delete_batch_size`` objects, so N files cost N / 100 round-trips
+        instead of N. Files that no longer exist are ignored.
+        
+        Args:
+            names: File paths to delete
+        """
+        from google.api_core.exceptions import NotFound
+        
+        try:
+            # Resolve the bucket first so any emulator bucket setup runs as
+            # normal requests rather than inside a batch
+            bucket = self.bucket
+            for start in range(0, len(names), self.delete_batch_size):
+                try:
+                    with self.client.batch():
+                        for name in names[start:start + self.delete_batch_size]:
+                            bucket.blob(name).delete()
+                except NotFound:
+                    # The rest of the batch has still been applied.
+                    pass
+            logger.info(f"Successfully deleted {len(names)} files")
+        except Exception as e:
+            logger.error(f"Failed to delete files: {e}")
+            raise
+
     def exists(self, name: str) -> bool:
         """
         Check if a file exists in GCS.
@@ -256,6 +319,126 @@ class GCSStorage(Storage):
             logger.error(f"Failed to list directory {path}: {e}")
             return [], []
 
+    def listdir_with_metadata(self, path: str) -> tuple:
+        """
+        List contents of a directory in GCS along with file metadata.
+        
+        The listing response already carries each blob's size and update time,
+        so this avoids the per-file metadata request made by size() and
+        get_modified_time().
+        
+        Args:
+            path: Directory path
+            
+        Returns:
+            Tuple of (directories, files) where files is a list of dicts with
+            'name', 'size' and 'modified_time' keys
+        """
+        if not path.endswith('/'):
+            path += '/'
+            
+        try:
+            blobs = self.client.list_blobs(self.bucket_name, prefix=path, delimiter='/')
+            
+            files = [
+                {
+                    'name': blob.name[len(path):],
+                    'size': blob.size or 0,
+                    'modified_time': blob.updated,
+                }
+                for blob in blobs
+                if blob.name != path  # Skip the directory itself
+            ]
+            
+            # Get prefixes (subdirectories)
+            dirs = [prefix[len(path):-1] for prefix in blobs.prefixes or []]
+            
+            return dirs, files
+            
+        except Exception as e:
+            logger.error(f"Failed to list directory {path}: {e}")
+            return [], []
+
+    def listdir_page(self, path: str, page_size: int, page_token: str = None) -> tuple:
+        """
+        List one page of a directory in GCS along with file metadata.
+        
+        Only a single listing request is made, so memory stays bounded by
+        page_size however large the directory is.
+        
+        Args:
+            path: Directory path
+            page_size: Maximum number of entries to return
+            page_token: Token returned by the previous page, if any
+            
+        Returns:
+            Tuple of (directories, files, next_page_token) where files is in
+            the same format as listdir_with_metadata() and next_page_token is
+            None on the last page
+        """
+        if not path.endswith('/'):
+            path += '/'
+            
+        try:
+            blobs = self.client.list_blobs(
+                self.bucket_name,
+                prefix=path,
+                delimiter='/',
+                max_results=page_size,
+                page_token=page_token,
+            )
+            page = next(blobs.pages, None)
+            if page is None:
+                return [], [], None
+            
+            files = [
+                {
+                    'name': blob.name[len(path):],
+                    'size': blob.size or 0,
+                    'modified_time': blob.updated,
+                }
+                for blob in page
+                if blob.name != path  # Skip the directory itself
+            ]
+            
+            dirs = [prefix[len(path):-1] for prefix in page.prefixes]
+            
+            return dirs, files, blobs.next_page_token
+            
+        except Exception as e:
+            logger.error(f"Failed to list directory {path}: {e}")
+            return [], [], None
+
+    def usage(self, path: str) -> Dict[str, int]:
+        """
+        Get total size and file count of everything under a path in GCS.
+        
+        Uses a single flat listing (no delimiter) rather than walking each
+        directory and fetching every file's size separately.
+        
+        Args:
+            path: Directory path
+            
+        Returns:
+            Dictionary with 'total_size' in bytes and 'file_count'
+        """
+        if path and not path.endswith('/'):
+            path += '/'
+            
+        total_size = 0
+        file_count = 0
+        try:
+            for blob in self.client.list_blobs(self.bucket_name, prefix=path):
+                if blob.name.endswith('/'):  # Skip directory placeholders
+                    continue
+                total_size += blob.size or 0
+                file_count += 1
+        except Exception as e:
+            logger.error(f"Failed to get storage usage for {path}: {e}")
+            raise
+            
+        return {'total_size': total_size, 'file_count': file_count}
+
     def size(self, name: str) -> int:
         """
         Get size of a file in GCS.
@@ -285,6 +468,10 @@ class GCSStorage(Storage):
         Returns:
             Signed URL for the file
         """
+        return self._signed_url(name, expire)
+
+    def _signed_url(self, name: str, expire: int) -> str:
+        """Generate a signed URL for an already scoped file path."""
         try:
             if self.use_emulator:
                 # For emulator, return a simple HTTP URL
@@ -292,13 +479,66 @@ class GCSStorage(Storage):
                 return f"{base_url}/storage/v1/b/{self.bucket_name}/o/{name.replace('/', '%2F')}?alt=media"
             else:
                 # For production, generate signed URL
+                # A bare integer is read as an absolute epoch timestamp, so pass
+                # the lifetime as a timedelta
                 blob = self.bucket.blob(name)
-                return blob.generate_signed_url(expiration=expire)
+                return blob.generate_signed_url(expiration=timedelta(seconds=expire))
                 
         except Exception as e:
             logger.error(f"Failed to generate URL for file {name}: {e}")
             raise
 
+    def urls(self, names: List[str], expire: int = 3600) -> Dict[str, str]:
+        """
+        Get signed URLs for several files.
+        
+        Files whose URL cannot be generated are logged and left out.
+        
+        Args:
+            names: File paths
+            expire: URL expiration time in seconds
+            
+        Returns:
+            Dictionary mapping each file path to its signed URL
+        """
+        signed = {}
+        for name in names:
+            try:
+                signed[name] = self._signed_url(name, expire)
+            except Exception as e:
+                logger.warning(f"Could not generate URL for file {name}: {e}")
+        return signed
+
+    def upload_url(self, name: str, content_type: str = None, expire: int = 3600) -> str:
+        """
+        Get a signed URL that lets a client upload a file directly with PUT.
+        
+        Args:
+            name: File path to upload to
+            content_type: Content type the client must send (optional)
+            expire: URL expiration time in seconds
+            
+        Returns:
+            Signed upload URL for the file
+        """
+        try:
+            if self.use_emulator:
+                # For emulator, return the simple media upload endpoint
+                base_url = self.client_options.get('api_endpoint', 'http://localhost:9090')
+                return f"{base_url}/upload/storage/v1/b/{self.bucket_name}/o?uploadType=media&name={name.replace('/', '%2F')}"
+            else:
+                blob = self.bucket.blob(name)
+                return blob.generate_signed_url(
+                    version="v4",
+                    expiration=timedelta(seconds=expire),
+                    method="PUT",
+                    content_type=content_type,
+                )
+                
+        except Exception as e:
+            logger.error(f"Failed to generate upload URL for file {name}: {e}")
+            raise
+
     def get_accessed_time(self, name: str):
         """Not supported by GCS."""
         raise NotImplementedError("GCS doesn't support accessed time")
@@ -392,6 +632,20 @@ class OrganizationScopedGCSStorage(GCSStorage):
         scoped_name = self._get_scoped_name(name)
         return super().delete(scoped_name)
 
+    def delete_many(self, names: List[str]) -> None:
+        """
+        Delete several files with organization scoping.
+        
+        The organization is resolved once for the whole batch instead of
+        once per file.
+        """
+        org_id = self._get_current_organization_id()
+        if not org_id:
+            raise PermissionDenied("No organization context available for file operation")
+            
+        scoped_names = [self._validate_organization_access(name, org_id) for name in names]
+        return super().delete_many(scoped_names)
+
     def exists(self, name: str) -> bool:
         """Check file existence with organization scoping."""
         scoped_name = self._get_scoped_name(name)
@@ -407,7 +661,44 @@ class OrganizationScopedGCSStorage(GCSStorage):
         scoped_name = self._get_scoped_name(name)
         return super().url(scoped_name, expire)
 
+    def urls(self, names: List[str], expire: int = 3600) -> Dict[str, str]:
+        """
+        Get signed URLs for several files with organization scoping.
+        
+        The organization is resolved once for the whole batch instead of
+        once per file.
+        """
+        org_id = self._get_current_organization_id()
+        if not org_id:
+            raise PermissionDenied("No organization context available for file operation")
+            
+        scoped_names = {
+            self._validate_organization_access(name, org_id): name for name in names
+        }
+        signed = super().urls(list(scoped_names), expire)
+        return {scoped_names[scoped_name]: url for scoped_name, url in signed.items()}
+
+    def upload_url(self, name: str, content_type: str = None, expire: int = 3600) -> str:
+        """Get signed upload URL with organization scoping."""
+        scoped_name = self._get_scoped_name(name)
+        return super().upload_url(scoped_name, content_type, expire)
+
     def listdir(self, path: str) -> tuple:
         """List directory with organization scoping."""
         scoped_path = self._get_scoped_name(path)
-        return super().listdir(scoped_path)
\ No newline at end of file
+        return super().listdir(scoped_path)
+
+    def listdir_with_metadata(self, path: str) -> tuple:
+        """List directory with file metadata and organization scoping."""
+        scoped_path = self._get_scoped_name(path)
+        return super().listdir_with_metadata(scoped_path)
+
+    def listdir_page(self, path: str, page_size: int, page_token: str = None) -> tuple:
+        """List one directory page with organization scoping."""
+        scoped_path = self._get_scoped_name(path)
+        return super().listdir_page(scoped_path, page_size, page_token)
+
+    def usage(self, path: str) -> Dict[str, int]:
+        """Get storage usage with organization scoping."""
+        scoped_path = self._get_scoped_name(path)
+        return super().usage(scoped_path)
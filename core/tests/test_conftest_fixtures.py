@@ -89,6 +89,20 @@ def test_sample_project_fixture(sample_project):
     assert sample_project.organization is not None
 
 
+def test_built_user_fixture(built_user):
+    """Test using built_user fixture from conftest without the database."""
+    assert isinstance(built_user, User)
+    assert built_user._state.adding is True
+    assert built_user.email.endswith("@example.com")
+
+
+def test_built_organization_fixture(built_organization):
+    """Test using built_organization fixture from conftest without the database."""
+    assert isinstance(built_organization, Organization)
+    assert built_organization._state.adding is True
+    assert built_organization.name is not None
+
+
 @pytest.mark.django_db
 def test_user_with_organization_fixture(user_with_organization):
     """Test using user_with_organization fixture from conftest."""
@@ -281,6 +281,16 @@ class TestUserOrganizationMethods(TestCase):
         result = self.user.get_default_organization()
         self.assertEqual(result, self.org1)
 
+    def test_get_default_organization_single_query(self):
+        """Test get_default_organization loads the organization with the membership."""
+        OrganizationMembership.objects.create(
+            user=self.user, organization=self.org1, role=OrgRole.ADMIN, is_default=True
+        )
+
+        with self.assertNumQueries(1):
+            result = self.user.get_default_organization()
+            self.assertEqual(result.name, self.org1.name)
+
     def test_get_default_organization_nonexistent(self):
         """Test get_default_organization method with no default set."""
         OrganizationMembership.objects.create(
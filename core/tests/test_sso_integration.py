@@ -13,7 +13,11 @@ from django.contrib.sites.models import Site
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
 
-from core.adapters import CustomAccountAdapter, CustomSocialAccountAdapter
+from core.adapters import (
+    CustomAccountAdapter,
+    CustomSocialAccountAdapter,
+    _language_for_locale,
+)
 from core.factories import UserFactory
 
 User = get_user_model()
@@ -200,6 +204,29 @@ class TestCustomSocialAccountAdapter(TestCase):
         # User should be connected
         self.assertEqual(social_login.user, existing_user)
 
+    def test_pre_social_login_returning_user_skips_lookup(self):
+        """Test pre_social_login does not look up users for connected accounts."""
+        UserFactory(email="test@example.com")
+        request = self.request_factory.get("/")
+        social_account = SocialAccount(
+            provider="google", uid="123456789", extra_data={"email": "test@example.com"}
+        )
+        social_login = type(
+            "MockSocialLogin",
+            (),
+            {
+                "account": social_account,
+                "user": None,
+                "is_existing": True,
+                "connect": lambda self, req, user: setattr(self, "user", user),
+            },
+        )()
+
+        with self.assertNumQueries(0):
+            self.adapter.pre_social_login(request, social_login)
+
+        self.assertIsNone(social_login.user)
+
     def test_save_user_from_social_login(self):
         """Test saving user from social login."""
         request = self.request_factory.post("/")
@@ -236,7 +263,9 @@ class TestCustomSocialAccountAdapter(TestCase):
         CustomSocialAccountAdapter.__bases__[0].save_user = mock_save_user
 
         try:
-            saved_user = self.adapter.save_user(request, social_login)
+            # The user row is written once, by the parent adapter
+            with self.assertNumQueries(1):
+                saved_user = self.adapter.save_user(request, social_login)
 
             # Check that custom logic was applied
             self.assertEqual(saved_user.full_name, "Social User")
@@ -247,6 +276,52 @@ class TestCustomSocialAccountAdapter(TestCase):
             # Restore original method
             CustomSocialAccountAdapter.__bases__[0].save_user = original_save_user
 
+    def test_save_user_from_signup_form_keeps_provider_locale(self):
+        """Test the signup form path keeps the provider locale and saves once."""
+        request = self.request_factory.post("/")
+        request.LANGUAGE_CODE = "en"
+
+        social_account = SocialAccount(
+            provider="google",
+            uid="123456789",
+            extra_data={"email": "social@example.com", "locale": "fr_FR"},
+        )
+        social_login = type(
+            "MockSocialLogin",
+            (),
+            {
+                "account": social_account,
+                "user": User(full_name="Social User"),
+                "is_existing": False,
+                "save": lambda self, req: self.user.save(),
+            },
+        )()
+        form = type("MockSignupForm", (), {
+            "cleaned_data": {"email": "social@example.com"}
+        })()
+
+        # The account adapter must not commit; sociallogin.save() inserts once
+        with self.assertNumQueries(1):
+            saved_user = self.adapter.save_user(request, social_login, form)
+
+        saved_user.refresh_from_db()
+        self.assertEqual(saved_user.language, "fr")
+        self.assertEqual(saved_user.email, "social@example.com")
+        self.assertFalse(saved_user.has_usable_password())
+
+    def test_language_for_locale(self):
+        """Test provider locales map to supported user languages."""
+        cases = {
+            "fr_FR": "fr",
+            "fr-CA": "fr",
+            "FR": "fr",
+            "en_US": "en",
+            "de_DE": "en",
+        }
+        for locale, language in cases.items():
+            with self.subTest(locale=locale):
+                self.assertEqual(_language_for_locale(locale), language)
+
 
 class TestSocialProviderConfiguration(TestCase):
     """Test social provider configuration."""
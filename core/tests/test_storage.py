@@ -5,17 +5,27 @@ This module tests the Google Cloud Storage integration with
 organization-scoped access control.
 """
 
+from datetime import timedelta
+
 import pytest
 from unittest.mock import patch, MagicMock, PropertyMock
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.exceptions import PermissionDenied, SuspiciousOperation
 from django.conf import settings
 
-from core.storage import GCSStorage, OrganizationScopedGCSStorage
+from core.storage import GCSStorage, OrganizationScopedGCSStorage, _reset_client_cache
 from core.factories import UserFactory, OrganizationFactory, OrganizationMembershipFactory
 from constants.roles import OrgRole
 
 
+@pytest.fixture(autouse=True)
+def reset_client_cache():
+    """Keep mocked GCS clients cached by one test out of every other test."""
+    _reset_client_cache()
+    yield
+    _reset_client_cache()
+
+
 @pytest.mark.django_db
 class TestGCSStorage:
     """Test base GCS storage functionality."""
@@ -62,6 +72,16 @@ class TestGCSStorage:
             assert client == mock_client
             mock_client_class.create_anonymous_client.assert_called_once()
 
+    def test_client_shared_between_instances(self):
+        """Test storage instances with the same configuration share one client."""
+        with patch('google.cloud.storage.Client') as mock_client_class:
+            first = GCSStorage(bucket_name="test", client_options={})
+            second = GCSStorage(bucket_name="test", client_options={})
+            first.use_emulator = second.use_emulator = False
+            
+            assert first.client is second.client
+            mock_client_class.assert_called_once_with()
+
     def test_bucket_initialization(self):
         """Test GCS bucket initialization."""
         with patch('google.cloud.storage.Client') as mock_client_class:
@@ -141,8 +161,12 @@ class TestGCSStorage:
         result = self.storage._save(file_path, content)
         
         assert result == file_path
-        mock_bucket.blob.assert_called_once_with(file_path)
-        mock_blob.upload_from_file.assert_called_once_with(content, rewind=True)
+        mock_bucket.blob.assert_called_once_with(
+            file_path, chunk_size=GCSStorage.upload_chunk_size
+        )
+        mock_blob.upload_from_file.assert_called_once_with(
+            content, rewind=True, size=content.size
+        )
 
     @patch.object(GCSStorage, 'bucket', new_callable=PropertyMock)
     def test_open_file(self, mock_bucket_prop):
@@ -211,6 +235,141 @@ class TestGCSStorage:
         mock_bucket.blob.assert_called_once_with(file_path)
         mock_blob.reload.assert_called_once()
 
+    @patch.object(GCSStorage, 'bucket', new_callable=PropertyMock)
+    @patch.object(GCSStorage, 'client', new_callable=PropertyMock)
+    def test_delete_many_batches_requests(self, mock_client_prop, mock_bucket_prop):
+        """Test bulk deletion groups deletes into batch requests of 100."""
+        mock_client = MagicMock()
+        mock_bucket = MagicMock()
+        mock_client_prop.return_value = mock_client
+        mock_bucket_prop.return_value = mock_bucket
+        names = [f"test/file{i}.txt" for i in range(250)]
+        
+        self.storage.delete_many(names)
+        
+        assert mock_client.batch.call_count == 3
+        # The bucket is resolved once up front, not per file inside the batches
+        assert mock_bucket_prop.call_count == 1
+        assert mock_bucket.blob.call_count == 250
+        assert mock_bucket.blob.return_value.delete.call_count == 250
+
+    @patch.object(GCSStorage, 'bucket', new_callable=PropertyMock)
+    @patch.object(GCSStorage, 'client', new_callable=PropertyMock)
+    def test_delete_many_ignores_missing_files(self, mock_client_prop, mock_bucket_prop):
+        """Test bulk deletion tolerates files that are already gone."""
+        from google.api_core.exceptions import NotFound
+        
+        mock_client = MagicMock()
+        mock_client.batch.return_value.__exit__.side_effect = NotFound("gone")
+        mock_client_prop.return_value = mock_client
+        mock_bucket_prop.return_value = MagicMock()
+        
+        self.storage.delete_many(["test/missing.txt"])
+
+    @patch.object(GCSStorage, 'client', new_callable=PropertyMock)
+    def test_listdir_with_metadata(self, mock_client_prop):
+        """Test listing a directory returns metadata without per-file requests."""
+        mock_client = MagicMock()
+        mock_client_prop.return_value = mock_client
+        file_blob = MagicMock()
+        file_blob.name = "docs/report.pdf"
+        file_blob.size = 2048
+        file_blob.updated = "2024-01-01T00:00:00Z"
+        dir_blob = MagicMock()
+        dir_blob.name = "docs/"
+        blobs = MagicMock()
+        blobs.__iter__.return_value = iter([dir_blob, file_blob])
+        blobs.prefixes = {"docs/archive/"}
+        mock_client.list_blobs.return_value = blobs
+        
+        dirs, files = self.storage.listdir_with_metadata("docs")
+        
+        mock_client.list_blobs.assert_called_once_with(
+            self.bucket_name, prefix="docs/", delimiter="/"
+        )
+        assert dirs == ["archive"]
+        assert files == [
+            {'name': "report.pdf", 'size': 2048, 'modified_time': "2024-01-01T00:00:00Z"}
+        ]
+        file_blob.reload.assert_not_called()
+
+    @patch.object(GCSStorage, 'client', new_callable=PropertyMock)
+    def test_listdir_page(self, mock_client_prop):
+        """Test listing a single directory page returns the next page token."""
+        mock_client = MagicMock()
+        mock_client_prop.return_value = mock_client
+        file_blob = MagicMock()
+        file_blob.name = "docs/report.pdf"
+        file_blob.size = 2048
+        file_blob.updated = "2024-01-01T00:00:00Z"
+        page = MagicMock()
+        page.__iter__.return_value = iter([file_blob])
+        page.prefixes = ("docs/archive/",)
+        blobs = MagicMock()
+        blobs.pages = iter([page])
+        blobs.next_page_token = "next-token"
+        mock_client.list_blobs.return_value = blobs
+        
+        dirs, files, next_token = self.storage.listdir_page("docs", 10, "token")
+        
+        mock_client.list_blobs.assert_called_once_with(
+            self.bucket_name, prefix="docs/", delimiter="/",
+            max_results=10, page_token="token"
+        )
+        assert dirs == ["archive"]
+        assert files == [
+            {'name': "report.pdf", 'size': 2048, 'modified_time': "2024-01-01T00:00:00Z"}
+        ]
+        assert next_token == "next-token"
+
+    @patch.object(GCSStorage, 'client', new_callable=PropertyMock)
+    def test_usage(self, mock_client_prop):
+        """Test usage sums a single flat listing and skips directory placeholders."""
+        mock_client = MagicMock()
+        mock_client_prop.return_value = mock_client
+        blobs = []
+        for name, size in [("docs/", 0), ("docs/a.txt", 100), ("docs/sub/b.txt", 50)]:
+            blob = MagicMock()
+            blob.name = name
+            blob.size = size
+            blobs.append(blob)
+        mock_client.list_blobs.return_value = iter(blobs)
+        
+        result = self.storage.usage("docs")
+        
+        mock_client.list_blobs.assert_called_once_with(self.bucket_name, prefix="docs/")
+        assert result == {'total_size': 150, 'file_count': 2}
+
+    @patch.object(GCSStorage, 'client', new_callable=PropertyMock)
+    def test_usage_logs_and_reraises_errors(self, mock_client_prop, caplog):
+        """Test usage logs listing failures before re-raising them."""
+        mock_client_prop.return_value.list_blobs.side_effect = RuntimeError("gcs down")
+        
+        with pytest.raises(RuntimeError):
+            self.storage.usage("docs")
+        
+        assert "Failed to get storage usage for docs/" in caplog.text
+
+    @patch.object(GCSStorage, 'bucket', new_callable=PropertyMock)
+    def test_upload_url_production(self, mock_bucket_prop):
+        """Test generating a signed PUT URL for direct uploads."""
+        mock_bucket = MagicMock()
+        mock_blob = MagicMock()
+        mock_bucket_prop.return_value = mock_bucket
+        mock_bucket.blob.return_value = mock_blob
+        mock_blob.generate_signed_url.return_value = "https://signed-upload-url.com"
+        self.storage.use_emulator = False
+        
+        result = self.storage.upload_url("test/file.pdf", content_type="application/pdf", expire=600)
+        
+        assert result == "https://signed-upload-url.com"
+        mock_blob.generate_signed_url.assert_called_once_with(
+            version="v4",
+            expiration=timedelta(seconds=600),
+            method="PUT",
+            content_type="application/pdf",
+        )
+
     @patch.object(GCSStorage, 'bucket', new_callable=PropertyMock)
     def test_url_production(self, mock_bucket_prop):
         """Test generating signed URL in production."""
@@ -226,7 +385,9 @@ class TestGCSStorage:
         result = self.storage.url(file_path)
         
         assert result == "https://signed-url.com"
-        mock_blob.generate_signed_url.assert_called_once_with(expiration=3600)
+        mock_blob.generate_signed_url.assert_called_once_with(
+            expiration=timedelta(seconds=3600)
+        )
 
     @patch.object(GCSStorage, 'bucket', new_callable=PropertyMock)
     def test_url_emulator(self, mock_bucket_prop):
@@ -341,6 +502,20 @@ class TestOrganizationScopedGCSStorage:
         expected_path = f"orgs/{self.org.id}/test.txt"
         mock_delete.assert_called_once_with(expected_path)
 
+    @patch.object(GCSStorage, 'delete_many')
+    def test_delete_many_with_scoping(self, mock_delete_many):
+        """Test bulk delete resolves the organization once for all files."""
+        with patch.object(
+            self.storage, '_get_current_organization_id', return_value=str(self.org.id)
+        ) as mock_get_org:
+            self.storage.delete_many(["a.txt", "docs/b.txt"])
+        
+        mock_get_org.assert_called_once()
+        mock_delete_many.assert_called_once_with([
+            f"orgs/{self.org.id}/a.txt",
+            f"orgs/{self.org.id}/docs/b.txt",
+        ])
+
     @patch.object(GCSStorage, 'exists')
     def test_exists_with_scoping(self, mock_exists):
         """Test exists operation with organization scoping."""
@@ -363,6 +538,22 @@ class TestOrganizationScopedGCSStorage:
         mock_url.assert_called_once_with(expected_path, 3600)
         assert result == "https://signed-url.com"
 
+    @patch.object(GCSStorage, '_signed_url')
+    def test_urls_with_scoping(self, mock_signed_url):
+        """Test batch URL generation resolves the organization once."""
+        mock_signed_url.side_effect = lambda name, expire: f"https://signed/{name}"
+        
+        with patch.object(
+            self.storage, '_get_current_organization_id', return_value=str(self.org.id)
+        ) as mock_get_org:
+            result = self.storage.urls(["a.txt", "docs/b.txt"])
+        
+        mock_get_org.assert_called_once()
+        assert result == {
+            "a.txt": f"https://signed/orgs/{self.org.id}/a.txt",
+            "docs/b.txt": f"https://signed/orgs/{self.org.id}/docs/b.txt",
+        }
+
     @patch.object(GCSStorage, 'size')
     def test_size_with_scoping(self, mock_size):
         """Test size operation with organization scoping."""
@@ -385,6 +576,25 @@ class TestOrganizationScopedGCSStorage:
         mock_listdir.assert_called_once_with(expected_path)
         assert result == ([], ["file1.txt", "file2.txt"])
 
+    @patch.object(GCSStorage, 'usage')
+    def test_usage_with_scoping(self, mock_usage):
+        """Test usage is computed over the organization prefix."""
+        mock_usage.return_value = {'total_size': 0, 'file_count': 0}
+        
+        self.storage.usage("")
+        
+        mock_usage.assert_called_once_with(f"orgs/{self.org.id}/")
+
+    @patch.object(GCSStorage, 'listdir_with_metadata')
+    def test_listdir_with_metadata_with_scoping(self, mock_listdir):
+        """Test metadata listing with organization scoping."""
+        mock_listdir.return_value = ([], [])
+        
+        self.storage.listdir_with_metadata("documents")
+        
+        expected_path = f"orgs/{self.org.id}/documents"
+        mock_listdir.assert_called_once_with(expected_path)
+
 
 @pytest.mark.django_db 
 class TestStorageIntegration:
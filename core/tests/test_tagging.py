@@ -7,9 +7,12 @@ objects by tag names using the new M2M relationship approach.
 """
 
 import pytest
+from django.contrib import admin
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, models
+from django.urls import resolve
 
+from core.admin import TagAdmin
 from core.factories import OrganizationFactory, ProjectFactory, TagFactory, UserFactory
 from core.models import Project, Tag
 
@@ -175,6 +178,56 @@ class TestTaggableMixin:
         assert result is True
         assert project.tags.count() == 0
 
+    def test_add_tags_creates_and_reuses_tags(self):
+        """Test add_tags creates missing tags and reuses existing ones."""
+        project = ProjectFactory()
+        user = UserFactory()
+        existing = project.add_tag("urgent")
+
+        tags = project.add_tags(["urgent", " important ", "important"], created_by=user)
+
+        assert {tag.title for tag in tags} == {"urgent", "important"}
+        assert existing in tags
+        assert project.tags.count() == 2
+        assert Tag.objects.get(title="important").created_by == user
+
+    def test_add_tags_rejects_blank_titles(self):
+        """Test add_tags validates titles like Tag.clean does."""
+        project = ProjectFactory()
+
+        with pytest.raises(ValidationError):
+            project.add_tags(["urgent", "   "])
+
+        assert project.tags.count() == 0
+
+    def test_add_tags_restores_soft_deleted_tag(self):
+        """Test add_tags brings back a soft deleted tag with the same title."""
+        project = ProjectFactory()
+        deleted = project.add_tag("urgent")
+        project.tags.clear()
+        deleted.soft_delete()
+
+        tags = project.add_tags(["urgent", "new"])
+
+        assert deleted in tags
+        assert Tag.objects.filter(pk=deleted.pk).exists()
+        assert set(project.get_tag_names()) == {"urgent", "new"}
+
+    def test_remove_tags_by_id(self):
+        """Test removing tags by primary key only detaches matching tags."""
+        project = ProjectFactory()
+        other_project = ProjectFactory(organization=project.organization)
+        project.add_tags(["urgent", "later"])
+        other_project.add_tag("urgent")
+
+        removed = Project.remove_tags_by_id(
+            project.pk, ["urgent", "missing"], project.organization_id
+        )
+
+        assert removed == 1
+        assert list(project.get_tag_names()) == ["later"]
+        assert list(other_project.get_tag_names()) == ["urgent"]
+
     def test_get_tag_names(self):
         """Test getting all tag names for an object."""
         project = ProjectFactory()
@@ -496,6 +549,43 @@ class TestTagsGlobalFunctionality:
         assert not Tag.objects.filter(id=tag_id).exists()
 
 
+@pytest.mark.django_db
+class TestTagAdminUsageCount:
+    """Test cases for the usage count shown in the Tag admin changelist."""
+
+    def test_usage_count_ignores_soft_deleted_objects(self, rf):
+        """Test soft deleted tagged objects are left out of the usage count."""
+        org = OrganizationFactory()
+        tag = TagFactory(title="counted", organization=org)
+        ProjectFactory(organization=org).tags.add(tag)
+        deleted_project = ProjectFactory(organization=org)
+        deleted_project.tags.add(tag)
+        deleted_project.soft_delete()
+
+        request = rf.get("/admin/core/tag/")
+        request.resolver_match = resolve("/admin/core/tag/")
+        request.user = UserFactory(is_staff=True, is_superuser=True)
+        tag_admin = TagAdmin(Tag, admin.site)
+        annotated = tag_admin.get_queryset(request).get(pk=tag.pk)
+
+        assert tag_admin.usage_count_display(annotated) == 1
+
+    def test_change_view_queryset_is_not_annotated(self, rf):
+        """Test the change form loads the full definition without list annotations."""
+        tag = TagFactory(definition="d" * 80)
+        path = f"/admin/core/tag/{tag.pk}/change/"
+
+        request = rf.get(path)
+        request.resolver_match = resolve(path)
+        request.user = UserFactory(is_staff=True, is_superuser=True)
+        tag_admin = TagAdmin(Tag, admin.site)
+        loaded = tag_admin.get_queryset(request).get(pk=tag.pk)
+
+        assert loaded.get_deferred_fields() == set()
+        assert not hasattr(loaded, "_usage_count")
+        assert tag_admin.definition_short(loaded) == "d" * 50 + "..."
+
+
 @pytest.mark.django_db
 class TestTagFactory:
     """Test cases for TagFactory."""
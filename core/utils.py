@@ -4,6 +4,9 @@ Utility functions for the core application.
 This module provides helper functions that can be used across the application.
 """
 
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
 
 def is_experimental_enabled(user) -> bool:
     """
@@ -34,3 +37,29 @@ def is_experimental_enabled(user) -> bool:
 
     # Default to False if no organization
     return False
+
+
+def count_per_row(queryset, field):
+    """
+    Build a correlated COUNT subquery of ``queryset`` rows pointing at the row.
+
+    Annotating with this keeps the counted relation out of the outer query's
+    joins, so list views get related counts without a COUNT per row or
+    duplicated outer rows. Pass the related model's default manager to leave
+    out soft deleted records.
+
+    Args:
+        queryset: Rows to count, e.g. ``Project.objects``
+        field: Lookup on ``queryset`` that points back at the outer row
+
+    Returns:
+        Expression: Integer count, 0 when there are no related rows
+    """
+    counts = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)